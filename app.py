@@ -1,23 +1,291 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session
+from flask import Flask, render_template, request, redirect, url_for, flash, session, g, jsonify, make_response, abort, \
+    stream_with_context
+from flask.cli import AppGroup
+from markupsafe import Markup
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.routing import IntegerConverter
 from werkzeug.security import generate_password_hash, check_password_hash
+import click
+import csv
+import itertools
+import json
+import math
+import os
 import sqlite3
+import hashlib
+import io
+import atexit
+import queue
+import re
+import unicodedata
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import wraps
-from datetime import datetime
+from datetime import datetime, timezone
 
 app = Flask(__name__)
 app.secret_key = 'your_secret_key_here'  # Change this to a secure secret key
 DATABASE = 'quotes.db'
+app.config.setdefault('DB_POOL_MAX_CONNECTIONS', 8)  # open connections per process
+app.config.setdefault('DB_POOL_TIMEOUT', 10)  # seconds a request waits for a free connection
+app.config.setdefault('DB_BUSY_TIMEOUT', 5000)  # milliseconds
+app.config.setdefault('SQLITE_PROFILE', 'performance')
+app.config.setdefault('WAL_CHECKPOINT_INTERVAL', 60)  # seconds
+app.config.setdefault('SECTION_CACHE_SIZE', 256)  # cached listing pages
+app.config.setdefault('SECTION_CACHE_ROWS', 20000)  # quotes held across all cached pages
+app.config.setdefault('STREAM_SECTIONS', False)  # stream unpaginated listings
+app.config.setdefault('STREAM_FETCH_SIZE', 200)  # rows per cursor fetch
+app.config.setdefault('STREAM_BUFFER_SIZE', 32)  # template chunks per write
+app.config.setdefault('COUNTER_FLUSH_INTERVAL', 5)  # seconds of counts lost at most on a crash
+app.config.setdefault('COUNTER_BUFFER_SIZE', 10000)  # quotes with pending counts; new ones are dropped beyond it
+app.config.setdefault('WRITE_BEHIND', False)  # group-commit quote submissions
+app.config.setdefault('WRITE_BATCH_SIZE', 100)  # rows per group commit
+app.config.setdefault('WRITE_BATCH_WINDOW', 5)  # milliseconds to wait for more rows
+app.config.setdefault('WRITE_QUEUE_SIZE', 1000)  # queued submissions before submitters block
+app.config.setdefault('DRAFT_TTL', 3600)  # seconds an unsubmitted draft is kept
+app.config.setdefault('DRAFT_SWEEP_INTERVAL', 60)  # seconds
+app.config.setdefault('DRAFT_SWEEP_BATCH', 500)  # drafts deleted per transaction
+app.config.setdefault('LOGIN_IP_PER_MINUTE', 10)  # login attempts per client address
+app.config.setdefault('LOGIN_IP_BURST', 20)
+app.config.setdefault('LOGIN_ACCOUNT_PER_MINUTE', 5)  # failed logins per account
+app.config.setdefault('LOGIN_ACCOUNT_BURST', 10)
+app.config.setdefault('LOGIN_LIMITER_SIZE', 100000)  # tracked addresses and accounts each
+app.config.setdefault('LOGIN_HASH_WORKERS', 2)  # concurrent password hash checks
+app.config.setdefault('LOGIN_HASH_QUEUE', 16)  # waiting checks before logins are turned away
+app.config.setdefault('ASGI_THREADS', app.config['DB_POOL_MAX_CONNECTIONS'])  # view threads in asgi.py
+app.config.setdefault('TEMPLATE_CACHE_DIR', os.path.join(app.instance_path, 'jinja-cache'))
+
+# PRAGMAs applied to every new connection, except journal_mode which is
+# persistent and set once by migrate(). busy_timeout always comes from
+# DB_BUSY_TIMEOUT.
+SQLITE_PROFILES = {
+    'default': {},
+    'performance': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64000,  # negative means KiB, so about 64 MB
+        'temp_store': 'MEMORY',
+    },
+}
+
+# Sections
+
+# Every section is named category + language code + kind code, e.g. 'love'
+# + 'h' + 'q' is 'lovehq' (Hindi love quotes). English has no language code.
+CATEGORIES = ['love', 'success', 'motivation', 'wisdom', 'sad', 'life']
+KINDS = {'q': 'quote', 'p': 'proverb'}
+KINDS_BY_NAME = {kind: code for code, kind in KINDS.items()}
+LANGUAGES = {'': 'english', 'c': 'chinese', 'f': 'french', 'g': 'german', 's': 'spanish', 'h': 'hindi'}
+
+Section = namedtuple('Section', ['name', 'category', 'kind', 'language'])
+
+SECTIONS = {category + language_code + kind_code: Section(category + language_code + kind_code, category, kind, language)
+            for language_code, language in LANGUAGES.items()
+            for kind_code, kind in KINDS.items()
+            for category in CATEGORIES}
+
+# Quotes store a section as integer keys into the categories, kinds and
+# languages lookup tables. Each key is the position in the definitions above,
+# so new entries must be appended, never inserted.
+CATEGORY_IDS = {category: number for number, category in enumerate(CATEGORIES, 1)}
+KIND_IDS = {kind: number for number, kind in enumerate(KINDS.values(), 1)}
+LANGUAGE_IDS = {language: number for number, language in enumerate(LANGUAGES.values(), 1)}
+SECTION_KEYS = {name: (CATEGORY_IDS[section.category], KIND_IDS[section.kind], LANGUAGE_IDS[section.language])
+                for name, section in SECTIONS.items()}
+SECTIONS_BY_KEY = {key: name for name, key in SECTION_KEYS.items()}
+
+# Timestamps
+
+# Quote timestamps are stored as integer milliseconds since the epoch (UTC),
+# so they sort and range-filter as plain integers; they are only turned into
+# text when a page is rendered.
+
+# SQLite integers are signed 64-bit; larger Python ints cannot be bound.
+SQLITE_INT_MIN = -2 ** 63
+SQLITE_INT_MAX = 2 ** 63 - 1
+
+def now_ms():
+    return int(time.time() * 1000)
+
+def sqlite_int(value):
+    # type= for integer request arguments that are bound to a query: a value
+    # SQLite cannot hold is treated like any other malformed one.
+    number = int(value)
+    if not SQLITE_INT_MIN <= number <= SQLITE_INT_MAX:
+        raise ValueError('integer out of range: %r' % (value,))
+    return number
+
+class IdConverter(IntegerConverter):
+    # <id:...> in routes: like <int:...>, but an id SQLite cannot hold is a
+    # 404 rather than an error from the query.
+
+    def __init__(self, url_map):
+        super().__init__(url_map, max=SQLITE_INT_MAX)
+
+app.url_map.converters['id'] = IdConverter
+
+def parse_timestamp(value):
+    # Accepts epoch milliseconds or an ISO 8601 date or date and time, taken
+    # as UTC unless it carries an offset. Raises ValueError otherwise,
+    # including for milliseconds outside SQLite's integer range.
+    if isinstance(value, int) and not isinstance(value, bool):
+        ms = value
+    elif not isinstance(value, str):
+        raise ValueError('not a timestamp: %r' % (value,))
+    elif value.strip().isdigit():
+        ms = int(value.strip())
+    else:
+        moment = datetime.fromisoformat(value.strip())
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        ms = int(moment.timestamp() * 1000)
+    if not SQLITE_INT_MIN <= ms <= SQLITE_INT_MAX:
+        raise ValueError('timestamp out of range: %r' % (value,))
+    return ms
+
+def parse_time_range(since, until):
+    # Optional bounds of a [since, until) range, as given in a query string or
+    # on the command line.
+    return (parse_timestamp(since) if since else None,
+            parse_timestamp(until) if until else None)
+
+@app.template_filter('format_ts')
+def format_ts(ms):
+    if not isinstance(ms, int):
+        return ms or ''
+    return datetime.fromtimestamp(ms / 1000, timezone.utc).strftime('%Y-%m-%d %H:%M UTC')
 
 # Database Initialization
 
+def get_sqlite_profile():
+    return SQLITE_PROFILES[app.config['SQLITE_PROFILE']]
+
 def get_db_connection():
-    conn = sqlite3.connect(DATABASE)
+    conn = sqlite3.connect(DATABASE, timeout=app.config['DB_BUSY_TIMEOUT'] / 1000, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA busy_timeout = %d' % app.config['DB_BUSY_TIMEOUT'])
+    for pragma, value in get_sqlite_profile().items():
+        if pragma != 'journal_mode':
+            conn.execute('PRAGMA %s = %s' % (pragma, value))
     return conn
 
-def init_db():
-    conn = get_db_connection()
-    c = conn.cursor()
+class ConnectionPool:
+    # Opens at most DB_POOL_MAX_CONNECTIONS connections per process and keeps
+    # them for reuse across requests; when all are in use, acquire() waits up
+    # to DB_POOL_TIMEOUT seconds for one to be released and returns None if
+    # none is. A connection is only ever used by one request at a time, so
+    # sharing it between worker threads over its lifetime is safe.
+
+    def __init__(self):
+        self._idle = []
+        self._open = 0
+        self._available = threading.Condition(threading.Lock())
+        self._stats = {'hits': 0, 'misses': 0, 'discarded': 0, 'timeouts': 0}
+
+    def acquire(self):
+        deadline = time.monotonic() + app.config['DB_POOL_TIMEOUT']
+        with self._available:
+            while not self._idle and self._open >= app.config['DB_POOL_MAX_CONNECTIONS']:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._available.wait(remaining):
+                    self._stats['timeouts'] += 1
+                    return None
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = None
+                self._open += 1
+                self._stats['misses'] += 1
+        if conn is None:
+            try:
+                return get_db_connection()
+            except sqlite3.Error:
+                self._discard()
+                raise
+        try:
+            conn.execute('SELECT 1')
+        except sqlite3.Error:
+            self._discard(counted=True)
+            return self.acquire()
+        with self._available:
+            self._stats['hits'] += 1
+        return conn
+
+    def _discard(self, counted=False):
+        with self._available:
+            self._open -= 1
+            if counted:
+                self._stats['discarded'] += 1
+            self._available.notify()
+
+    def release(self, conn):
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._discard(counted=True)
+            return
+        with self._available:
+            if self._open > app.config['DB_POOL_MAX_CONNECTIONS']:
+                # The limit was lowered while this connection was in use.
+                self._open -= 1
+                conn.close()
+            else:
+                self._idle.append(conn)
+            self._available.notify()
+
+    def stats(self):
+        with self._available:
+            stats = dict(self._stats)
+            stats['idle'] = len(self._idle)
+            stats['open'] = self._open
+        stats['max_connections'] = app.config['DB_POOL_MAX_CONNECTIONS']
+        return stats
+
+db_pool = ConnectionPool()
+
+def get_db():
+    if 'db' not in g:
+        conn = db_pool.acquire()
+        if conn is None:
+            abort(503)
+        g.db = conn
+    return g.db
+
+@app.teardown_appcontext
+def release_db(exception):
+    conn = g.pop('db', None)
+    if conn is not None:
+        db_pool.release(conn)
+
+def section_name_sql(alias):
+    # SQL expression for the section name of a quotes row, e.g. 'lovehq'.
+    return ('(SELECT name FROM categories WHERE id = {0}.category_id) || '
+            '(SELECT code FROM languages WHERE id = {0}.language_id) || '
+            '(SELECT code FROM kinds WHERE id = {0}.kind_id)').format(alias)
+
+def sections_condition(alias, section_names):
+    # Returns (sql, params) matching quotes rows in any of section_names.
+    if len(section_names) == 1:
+        return ('{0}.category_id = ? AND {0}.kind_id = ? AND {0}.language_id = ?'.format(alias),
+                list(SECTION_KEYS[section_names[0]]))
+    return ('({0}.category_id, {0}.kind_id, {0}.language_id) IN (VALUES {1})'.format(
+                alias, ', '.join(['(?, ?, ?)'] * len(section_names))),
+            [key for name in section_names for key in SECTION_KEYS[name]])
+
+# Schema migrations. Each migration takes a cursor inside the transaction
+# opened by migrate() and must not commit; the schema_version table records
+# how many have been applied. New schema changes are appended to MIGRATIONS
+# so existing databases pick up only what they miss. Objects derived from
+# the quotes table (indexes, search indexes, the leaderboard) are not
+# migrated step by step: migrate() brings them to their current definitions
+# after the last migration, so they are always built for the current table.
+
+def create_base_tables(c):
     c.execute('''CREATE TABLE IF NOT EXISTS users (
                  id INTEGER PRIMARY KEY AUTOINCREMENT,
                  username TEXT UNIQUE NOT NULL,
@@ -31,22 +299,378 @@ def init_db():
                  section TEXT NOT NULL,
                  timestamp DATETIME,
                  completed INTEGER DEFAULT 0)''')
-    conn.commit()
-    conn.close()
-
-def ensure_completed_column():
-    conn = get_db_connection()
-    c = conn.cursor()
+    # Databases from before the completed flag was introduced.
     c.execute("PRAGMA table_info(quotes)")
     columns = [row[1] for row in c.fetchall()]
     if 'completed' not in columns:
         c.execute("ALTER TABLE quotes ADD COLUMN completed INTEGER DEFAULT 0")
-        conn.commit()
-    conn.close()
 
+def create_section_versions(c):
+    c.execute('''CREATE TABLE IF NOT EXISTS section_versions (
+                 section TEXT PRIMARY KEY,
+                 version INTEGER NOT NULL,
+                 updated_at INTEGER NOT NULL)''')
+
+# Secondary indexes on quotes, all partial on completed = 1. Each listing
+# (a section, one category and kind across languages, one language and kind
+# across categories) has an index whose equality columns are followed by id,
+# so it is a single range scan in ORDER BY id DESC order, without a temp
+# b-tree. The timestamp indexes serve the leaderboard backfill and time-range
+# queries.
+QUOTE_INDEXES = {
+    'idx_quotes_section_id': '(category_id, kind_id, language_id, id DESC)',
+    'idx_quotes_category_kind_id': '(category_id, kind_id, id DESC)',
+    'idx_quotes_language_kind_id': '(language_id, kind_id, id DESC)',
+    'idx_quotes_section_timestamp': '(category_id, kind_id, language_id, timestamp)',
+    'idx_quotes_completed_timestamp': '(timestamp DESC)',
+}
+
+def ensure_indexes(c):
+    for name, columns in QUOTE_INDEXES.items():
+        c.execute('CREATE INDEX IF NOT EXISTS %s ON quotes %s WHERE completed = 1' % (name, columns))
+
+# Search indexes, one per tokenizer. Chinese has no word boundaries, so its
+# sections get a trigram index; every other language shares a unicode61 index
+# that folds Latin diacritics and keeps Devanagari combining marks (vowel
+# signs, virama, nukta) inside words instead of splitting on them.
+DEVANAGARI_MARKS = ''.join(chr(cp) for cp in range(0x900, 0x980)
+                           if unicodedata.category(chr(cp)) in ('Mn', 'Mc'))
+CHINESE_SECTIONS = [section.name for section in SECTIONS.values() if section.language == 'chinese']
+SEARCH_INDEXES = {
+    'quotes_fts': ("unicode61 remove_diacritics 2 tokenchars '%s'" % DEVANAGARI_MARKS, '!='),
+    'quotes_fts_cjk': ('trigram', '='),
+}
+
+def search_index_schema(index, tokenizer, operator):
+    # Each index reads its rows through a view restricted to its languages, so
+    # FTS5's 'rebuild' only ever sees the rows that belong to it.
+    view = index + '_content'
+    condition = "%%s.language_id %s %d" % (operator, LANGUAGE_IDS['chinese'])
+    return [
+        (view, 'CREATE VIEW %s AS SELECT id, quote, author, explanation FROM quotes WHERE %s'
+         % (view, condition % 'quotes')),
+        (index, "CREATE VIRTUAL TABLE %s USING fts5(quote, author, explanation, content='%s', "
+                "content_rowid='id', tokenize=\"%s\")" % (index, view, tokenizer)),
+        (index + '_insert', 'CREATE TRIGGER %s_insert AFTER INSERT ON quotes WHEN %s BEGIN '
+                            'INSERT INTO %s (rowid, quote, author, explanation) '
+                            'VALUES (new.id, new.quote, new.author, new.explanation); END'
+         % (index, condition % 'new', index)),
+        (index + '_delete', "CREATE TRIGGER %s_delete AFTER DELETE ON quotes WHEN %s BEGIN "
+                            "INSERT INTO %s (%s, rowid, quote, author, explanation) "
+                            "VALUES ('delete', old.id, old.quote, old.author, old.explanation); END"
+         % (index, condition % 'old', index, index)),
+        (index + '_update', "CREATE TRIGGER %s_update AFTER UPDATE OF quote, author, explanation ON quotes "
+                            "WHEN %s BEGIN "
+                            "INSERT INTO %s (%s, rowid, quote, author, explanation) "
+                            "VALUES ('delete', old.id, old.quote, old.author, old.explanation); "
+                            "INSERT INTO %s (rowid, quote, author, explanation) "
+                            "VALUES (new.id, new.quote, new.author, new.explanation); END"
+         % (index, condition % 'old', index, index, index)),
+    ]
+
+def ensure_search_index(c):
+    # Objects whose stored definition differs from the wanted one (a new
+    # tokenizer, a changed section list) are dropped and recreated, and the
+    # index is rebuilt from its view. Runs under a savepoint so a SQLite
+    # without FTS5 leaves the surrounding transaction untouched.
+    c.execute("SELECT name, type, sql FROM sqlite_master WHERE name LIKE 'quotes_fts%'")
+    existing = {row[0]: (row[1], row[2]) for row in c.fetchall()}
+    c.execute('SAVEPOINT search_index')
+    try:
+        for index, (tokenizer, operator) in SEARCH_INDEXES.items():
+            schema = search_index_schema(index, tokenizer, operator)
+            if all(existing.get(name, (None, None))[1] == sql for name, sql in schema):
+                continue
+            for name, sql in reversed(schema):
+                if name in existing:
+                    c.execute('DROP %s %s' % (existing[name][0].upper(), name))
+            for name, sql in schema:
+                c.execute(sql)
+            c.execute("INSERT INTO %s (%s) VALUES ('rebuild')" % (index, index))
+    except sqlite3.OperationalError:
+        app.logger.warning('SQLite was built without FTS5 or the trigram tokenizer; search is disabled')
+        c.execute('ROLLBACK TO search_index')
+        c.execute('RELEASE search_index')
+        return False
+    c.execute('RELEASE search_index')
+    return True
+
+# Leaderboard of the newest quotes, kept per scope: 'all', each language and
+# each category. Writes keep it current (see record_top_quote), so /top reads
+# a handful of rows by primary key instead of sorting the quotes table.
+TOP_QUOTES_SIZE = 5
+TOP_QUOTES_MAX = 50
+TOP_SCOPES = {'all': list(SECTIONS)}
+TOP_SCOPES.update(('language:' + language, [section.name for section in SECTIONS.values() if section.language == language])
+                  for language in LANGUAGES.values())
+TOP_SCOPES.update(('category:' + category, [section.name for section in SECTIONS.values() if section.category == category])
+                  for category in CATEGORIES)
+
+def top_quote_scopes(section):
+    return ('all', 'language:' + section.language, 'category:' + section.category)
+
+def ensure_top_quotes(c):
+    # Fill an empty leaderboard from existing quotes, e.g. after an upgrade.
+    c.execute('SELECT 1 FROM top_quotes LIMIT 1')
+    if c.fetchone() is None:
+        for scope, section_names in TOP_SCOPES.items():
+            condition, params = sections_condition('q', section_names)
+            c.execute('''INSERT INTO top_quotes (scope, timestamp, quote_id, section, quote, author, explanation)
+                         SELECT ?, COALESCE(q.timestamp, 0), q.id, %s, q.quote, q.author, q.explanation
+                         FROM quotes q WHERE q.completed = 1 AND %s
+                         ORDER BY q.timestamp DESC, q.id DESC LIMIT ?''' % (section_name_sql('q'), condition),
+                      [scope] + params + [TOP_QUOTES_MAX])
+
+def create_top_quotes(c):
+    c.execute('''CREATE TABLE IF NOT EXISTS top_quotes (
+                 scope TEXT NOT NULL,
+                 timestamp DATETIME NOT NULL,
+                 quote_id INTEGER NOT NULL,
+                 section TEXT NOT NULL,
+                 quote TEXT NOT NULL,
+                 author TEXT NOT NULL,
+                 explanation TEXT NOT NULL,
+                 PRIMARY KEY (scope, timestamp, quote_id)) WITHOUT ROWID''')
+
+def create_quote_stats(c):
+    c.execute('''CREATE TABLE IF NOT EXISTS quote_stats (
+                 quote_id INTEGER PRIMARY KEY,
+                 views INTEGER NOT NULL DEFAULT 0,
+                 likes INTEGER NOT NULL DEFAULT 0)''')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_quote_stats_views ON quote_stats (views DESC)')
 
-init_db()
-ensure_completed_column()
+def create_drafts(c):
+    c.execute('''CREATE TABLE IF NOT EXISTS drafts (
+                 id INTEGER PRIMARY KEY AUTOINCREMENT,
+                 section TEXT NOT NULL,
+                 created_at INTEGER NOT NULL,
+                 expires_at INTEGER NOT NULL)''')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_drafts_expires_at ON drafts (expires_at)')
+    # Drafts used to be empty quotes rows with completed = 0. They now live in
+    # the drafts table, so any left over are abandoned.
+    c.execute('DELETE FROM quotes WHERE completed = 0')
+
+def timestamps_to_epoch_ms(c):
+    # Timestamps used to be local-time text, '%Y-%m-%d %H:%M:%S' or
+    # '%Y-%m-%d %H:%M', which compare as strings and so sort and range-filter
+    # wrongly across the two formats. The 'utc' modifier converts from the
+    # server's local time they were written in. The leaderboard is emptied so
+    # that it is rebuilt from the converted rows.
+    c.execute("UPDATE quotes SET timestamp = CAST(strftime('%s', timestamp, 'utc') AS INTEGER) * 1000 "
+              "WHERE typeof(timestamp) = 'text'")
+    c.execute('DELETE FROM top_quotes')
+
+def fill_lookup_tables(c):
+    c.executemany('INSERT OR IGNORE INTO categories (id, name) VALUES (?, ?)',
+                  [(number, category) for category, number in CATEGORY_IDS.items()])
+    c.executemany('INSERT OR IGNORE INTO kinds (id, code, name) VALUES (?, ?, ?)',
+                  [(KIND_IDS[kind], code, kind) for code, kind in KINDS.items()])
+    c.executemany('INSERT OR IGNORE INTO languages (id, code, name) VALUES (?, ?, ?)',
+                  [(LANGUAGE_IDS[language], code, language) for code, language in LANGUAGES.items()])
+
+def normalize_sections(c):
+    # Replaces the free-text section column with integer keys into lookup
+    # tables. SQLite cannot change columns in place, so the table is rebuilt
+    # and renamed, keeping ids and the AUTOINCREMENT high-water mark (ids of
+    # deleted quotes are never reused, as quote_stats may still refer to
+    # them). Quotes in sections that are not in SECTIONS have no key; they
+    # are moved to quotes_quarantine, columns unchanged, instead of being
+    # lost. The search views read quotes and would block the rename; they
+    # are recreated with the other derived objects afterwards.
+    c.execute('CREATE TABLE IF NOT EXISTS categories (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)')
+    c.execute('''CREATE TABLE IF NOT EXISTS kinds (
+                 id INTEGER PRIMARY KEY,
+                 code TEXT UNIQUE NOT NULL,
+                 name TEXT UNIQUE NOT NULL)''')
+    c.execute('''CREATE TABLE IF NOT EXISTS languages (
+                 id INTEGER PRIMARY KEY,
+                 code TEXT UNIQUE NOT NULL,
+                 name TEXT UNIQUE NOT NULL)''')
+    fill_lookup_tables(c)
+    c.execute("SELECT name FROM sqlite_master WHERE type = 'view' AND name LIKE 'quotes_fts%'")
+    for (view,) in c.fetchall():
+        c.execute('DROP VIEW %s' % view)
+    c.execute('''CREATE TABLE quotes_new (
+                 id INTEGER PRIMARY KEY AUTOINCREMENT,
+                 quote TEXT NOT NULL,
+                 author TEXT NOT NULL,
+                 explanation TEXT NOT NULL,
+                 category_id INTEGER NOT NULL REFERENCES categories (id),
+                 kind_id INTEGER NOT NULL REFERENCES kinds (id),
+                 language_id INTEGER NOT NULL REFERENCES languages (id),
+                 timestamp INTEGER,
+                 completed INTEGER DEFAULT 0)''')
+    c.execute('CREATE TEMP TABLE section_keys (section TEXT PRIMARY KEY, category_id, kind_id, language_id)')
+    c.executemany('INSERT INTO temp.section_keys VALUES (?, ?, ?, ?)',
+                  [(name,) + key for name, key in SECTION_KEYS.items()])
+    c.execute('SELECT COUNT(*) FROM quotes WHERE section NOT IN (SELECT section FROM temp.section_keys)')
+    unknown = c.fetchone()[0]
+    if unknown:
+        app.logger.warning('Moving %d quotes in unknown sections to quotes_quarantine', unknown)
+        c.execute('CREATE TABLE quotes_quarantine AS SELECT * FROM quotes '
+                  'WHERE section NOT IN (SELECT section FROM temp.section_keys)')
+    c.execute('''INSERT INTO quotes_new (id, quote, author, explanation, category_id, kind_id, language_id,
+                                         timestamp, completed)
+                 SELECT q.id, q.quote, q.author, q.explanation, k.category_id, k.kind_id, k.language_id,
+                        q.timestamp, q.completed
+                 FROM quotes q JOIN temp.section_keys k ON k.section = q.section''')
+    c.execute("SELECT seq FROM sqlite_sequence WHERE name = 'quotes'")
+    row = c.fetchone()
+    c.execute('DROP TABLE temp.section_keys')
+    c.execute('DROP TABLE quotes')
+    c.execute('ALTER TABLE quotes_new RENAME TO quotes')
+    if row is not None:
+        c.execute("UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'quotes'", (row[0],))
+
+def add_section_stats_versions(c):
+    # Flushed view and like counts change a listing without a write to the
+    # section, so they get a generation of their own.
+    c.execute('ALTER TABLE section_versions ADD COLUMN stats_version INTEGER NOT NULL DEFAULT 0')
+
+MIGRATIONS = [
+    create_base_tables,
+    create_section_versions,
+    None,  # listing indexes, now derived objects
+    None,  # search indexes, likewise
+    create_top_quotes,
+    create_quote_stats,
+    create_drafts,
+    timestamps_to_epoch_ms,
+    normalize_sections,
+    add_section_stats_versions,
+]
+
+def get_schema_version(c):
+    try:
+        row = c.execute('SELECT version FROM schema_version').fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] if row else 0
+
+# The schema is brought up to date once per process: explicitly by serve.py
+# and the CLI, or else by the first request. Importing the module touches
+# nothing on disk.
+schema_ready = False
+schema_lock = threading.Lock()
+search_available = False
+
+def derived_objects_missing(c):
+    # Indexes and search triggers can go missing outside a migration, e.g.
+    # when an import that dropped them (see import_quotes) is killed before it
+    # rebuilds them. A search index that was never created (no FTS5) is not
+    # counted as missing.
+    c.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view', 'index', 'trigger')")
+    names = set(row[0] for row in c.fetchall())
+    wanted = set(QUOTE_INDEXES)
+    for index, (tokenizer, operator) in SEARCH_INDEXES.items():
+        if index in names:
+            wanted.update(name for name, _ in search_index_schema(index, tokenizer, operator))
+    return not wanted <= names
+
+def migrate():
+    # A current database costs two SELECTs. Otherwise the pending migrations
+    # run in a single write transaction, so concurrent processes starting
+    # together apply them exactly once and never see a half-built schema.
+    # Missing derived objects are recreated the same way.
+    global schema_ready, search_available
+    conn = get_db_connection()
+    try:
+        c = conn.cursor()
+        journal_mode = get_sqlite_profile().get('journal_mode')
+        if journal_mode and c.execute('PRAGMA journal_mode').fetchone()[0].upper() != journal_mode.upper():
+            c.execute('PRAGMA journal_mode = %s' % journal_mode)
+        version = get_schema_version(c)
+        if version < len(MIGRATIONS) or derived_objects_missing(c):
+            c.execute('BEGIN IMMEDIATE')
+            c.execute('CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)')
+            version = get_schema_version(c)
+            for number, migration in enumerate(MIGRATIONS[version:], version + 1):
+                if migration is not None:
+                    migration(c)
+                    app.logger.info('Applied schema migration %d (%s)', number, migration.__name__)
+            ensure_indexes(c)
+            ensure_search_index(c)
+            ensure_top_quotes(c)
+            c.execute('DELETE FROM schema_version')
+            c.execute('INSERT INTO schema_version (version) VALUES (?)', (len(MIGRATIONS),))
+            conn.commit()
+        c.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN (%s)"
+                  % ', '.join('?' * len(SEARCH_INDEXES)), list(SEARCH_INDEXES))
+        search_available = c.fetchone()[0] == len(SEARCH_INDEXES)
+    finally:
+        conn.close()
+    schema_ready = True
+    return len(MIGRATIONS)
+
+@app.before_request
+def ensure_schema():
+    if schema_ready:
+        return
+    with schema_lock:
+        if not schema_ready:
+            migrate()
+        use_template_cache()
+
+# Background Tasks
+
+# Tasks run in daemon threads started on the first request rather than at
+# import time, so that each forked worker process gets its own threads.
+background_tasks = []
+background_started = False
+background_lock = threading.Lock()
+
+def background_task(interval_key):
+    def decorator(f):
+        background_tasks.append((interval_key, f))
+        return f
+    return decorator
+
+def run_background_task(interval_key, f):
+    while True:
+        time.sleep(app.config[interval_key])
+        try:
+            with app.app_context():
+                f()
+        except Exception:
+            app.logger.exception('Background task %s failed', f.__name__)
+
+@app.before_request
+def start_background_tasks():
+    global background_started
+    if background_started:
+        return
+    with background_lock:
+        if background_started:
+            return
+        for interval_key, f in background_tasks:
+            threading.Thread(target=run_background_task, args=(interval_key, f),
+                             name=f.__name__, daemon=True).start()
+        background_started = True
+
+@background_task('WAL_CHECKPOINT_INTERVAL')
+def checkpoint_wal():
+    # SQLite's autocheckpoint only runs on commit; this keeps the WAL short
+    # during read-heavy periods. PASSIVE never blocks readers or writers.
+    if get_sqlite_profile().get('journal_mode') == 'WAL':
+        get_db().execute('PRAGMA wal_checkpoint(PASSIVE)')
+
+draft_sweeps = {'runs': 0, 'deleted': 0}
+
+@background_task('DRAFT_SWEEP_INTERVAL')
+def sweep_drafts():
+    # Expired drafts are deleted a small batch per transaction, so the write
+    # lock is never held for long and submissions interleave with the sweep.
+    conn = get_db()
+    batch_size = app.config['DRAFT_SWEEP_BATCH']
+    now = int(time.time())
+    while True:
+        deleted = conn.execute('DELETE FROM drafts WHERE id IN '
+                               '(SELECT id FROM drafts WHERE expires_at <= ? LIMIT ?)', (now, batch_size)).rowcount
+        conn.commit()
+        draft_sweeps['deleted'] += deleted
+        if deleted < batch_size:
+            break
+    draft_sweeps['runs'] += 1
 
 # Authentication & User Management
 
@@ -69,7 +693,7 @@ def signup():
         username = request.form['username']
         email = request.form['email']
         password = request.form['password']
-        conn = get_db_connection()
+        conn = get_db()
         c = conn.cursor()
         try:
             hashed_password = generate_password_hash(password)
@@ -80,26 +704,141 @@ def signup():
             return redirect(url_for('login'))
         except sqlite3.IntegrityError:
             flash('Email or username already exists.', 'error')
-        finally:
-            conn.close()
     return render_template('signup.html')
 
+class TokenBucket:
+    # Per-key token buckets refilled at per_minute_key tokens a minute up to
+    # burst_key. Only the LOGIN_LIMITER_SIZE most recently used keys are
+    # tracked; a forgotten key starts again with a full bucket.
+
+    def __init__(self, per_minute_key, burst_key):
+        self.per_minute_key = per_minute_key
+        self.burst_key = burst_key
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _tokens(self, key, now):
+        burst = app.config[self.burst_key]
+        tokens, updated = self._buckets.get(key, (burst, now))
+        return min(burst, tokens + (now - updated) * app.config[self.per_minute_key] / 60.0)
+
+    def allow(self, key):
+        with self._lock:
+            return self._tokens(key, time.monotonic()) >= 1
+
+    def take(self, key):
+        # Returns False, leaving the bucket as it was, when it is empty.
+        with self._lock:
+            now = time.monotonic()
+            tokens = self._tokens(key, now)
+            if tokens < 1:
+                return False
+            self._buckets[key] = (tokens - 1, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > app.config['LOGIN_LIMITER_SIZE']:
+                self._buckets.popitem(last=False)
+            return True
+
+    def retry_after(self, key):
+        with self._lock:
+            missing = 1 - self._tokens(key, time.monotonic())
+        return max(1, int(missing * 60.0 / app.config[self.per_minute_key]) + 1)
+
+login_ip_limiter = TokenBucket('LOGIN_IP_PER_MINUTE', 'LOGIN_IP_BURST')
+login_account_limiter = TokenBucket('LOGIN_ACCOUNT_PER_MINUTE', 'LOGIN_ACCOUNT_BURST')
+
+class PasswordChecker:
+    # check_password_hash is deliberately slow. Running it on a small pool
+    # caps the CPU that logins can take, however many arrive at once, and
+    # logins beyond LOGIN_HASH_QUEUE waiting checks are refused rather than
+    # queued behind them.
+
+    def __init__(self):
+        self._executor = None
+        self._slots = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=1000)
+        self._stats = {'attempts': 0, 'successes': 0, 'failures': 0,
+                       'rejected_ip': 0, 'rejected_account': 0, 'rejected_busy': 0}
+
+    def check(self, password_hash, password):
+        # Returns True or False, or None when the pool is saturated.
+        with self._lock:
+            # A forked worker inherits the pool object but not its threads.
+            if self._executor is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._executor = ThreadPoolExecutor(max_workers=app.config['LOGIN_HASH_WORKERS'],
+                                                    thread_name_prefix='password_check')
+                self._slots = threading.BoundedSemaphore(app.config['LOGIN_HASH_WORKERS'] +
+                                                         app.config['LOGIN_HASH_QUEUE'])
+        if not self._slots.acquire(blocking=False):
+            return None
+        start = time.perf_counter()
+        try:
+            return self._executor.submit(check_password_hash, password_hash, password).result()
+        finally:
+            self._slots.release()
+            with self._lock:
+                self._latencies.append((time.perf_counter() - start) * 1000)
+
+    def count(self, outcome):
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            latencies = sorted(self._latencies)
+        if latencies:
+            stats['check_p50_ms'] = round(latencies[len(latencies) // 2], 3)
+            stats['check_p95_ms'] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3)
+        return stats
+
+password_checker = PasswordChecker()
+
+def reject_login(outcome, message, status, retry_after=None):
+    password_checker.count(outcome)
+    flash(message, 'error')
+    response = make_response(render_template('login.html'), status)
+    if retry_after is not None:
+        response.headers['Retry-After'] = str(retry_after)
+    return response
+
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         email = request.form['email']
         password = request.form['password']
-        conn = get_db_connection()
+        password_checker.count('attempts')
+        # Both limits are checked before any hashing. Every attempt spends an
+        # address token; only failures spend the account's, so a correct
+        # password is still accepted while an account is under attack from
+        # elsewhere until the account's bucket is empty.
+        address = request.remote_addr or ''
+        account = email.strip().lower()
+        if not login_ip_limiter.take(address):
+            return reject_login('rejected_ip', 'Too many login attempts. Please try again later.', 429,
+                                login_ip_limiter.retry_after(address))
+        if not login_account_limiter.allow(account):
+            return reject_login('rejected_account', 'Too many login attempts. Please try again later.', 429,
+                                login_account_limiter.retry_after(account))
+        conn = get_db()
         c = conn.cursor()
         c.execute("SELECT * FROM users WHERE email = ?", (email,))
         user = c.fetchone()
-        conn.close()
-        if user and check_password_hash(user[3], password):
+        valid = password_checker.check(user[3], password) if user else False
+        if valid is None:
+            return reject_login('rejected_busy', 'The server is busy. Please try again shortly.', 503, 1)
+        if valid:
+            password_checker.count('successes')
             session['user_id'] = user[0]
             session['username'] = user[1]
             flash('Login successful!', 'success')
             return redirect(url_for('home'))
         else:
+            password_checker.count('failures')
+            login_account_limiter.take(account)
             flash('Invalid email or password.', 'error')
     return render_template('login.html')
 
@@ -112,6 +851,559 @@ def logout():
 
 # Quotes Management
 
+# Interface text for the shared section layout. 'sections' follows
+# SIDEBAR_ORDER; 'languages' names every language in this language.
+SIDEBAR_ORDER = [(category, kind) for kind in ('quote', 'proverb')
+                 for category in ['love', 'motivation', 'sad', 'wisdom', 'life', 'success']]
+LANGUAGE_PAGES = {'english': 'home', 'chinese': 'chinese', 'french': 'french',
+                  'german': 'german', 'spanish': 'spanish', 'hindi': 'hindi'}
+ABOUT_PAGES = {'english': 'about', 'chinese': 'cabout', 'french': 'fabout',
+               'german': 'gabout', 'spanish': 'sabout', 'hindi': 'habout'}
+UI_TEXT = {
+    'english': {
+        'html_lang': 'en', 'site_name': 'Quotes and Proverbs',
+        'home': 'Home', 'quotes': 'Quotes', 'proverbs': 'Proverbs', 'about': 'About',
+        'logout': 'Logout', 'login': 'Login', 'categories': 'Categories',
+        'quote_label': 'Quote:', 'author_label': 'Author:', 'explanation_label': 'Explanation:',
+        'submit': 'Submit', 'close': 'Close', 'older': 'Older',
+        'top': 'Latest', 'most_viewed': 'Most viewed', 'views': 'views',
+        'languages': {'english': 'English', 'chinese': 'Chinese', 'french': 'French',
+                      'german': 'German', 'spanish': 'Spanish', 'hindi': 'Hindi'},
+        'sections': ['Love Quotes', 'Motivation Quotes', 'Sad Quotes', 'Wisdom Quotes', 'Life Quotes', 'Success Quotes',
+                     'Love Proverbs', 'Motivation Proverbs', 'Sad Proverbs', 'Wisdom Proverbs', 'Life Proverbs', 'Success Proverbs'],
+    },
+    'chinese': {
+        'html_lang': 'zh', 'site_name': '名言和谚语',
+        'home': '首页', 'quotes': '名言', 'proverbs': '谚语', 'about': '关于我们',
+        'logout': '登出', 'login': '登录', 'categories': '类别',
+        'quote_label': '语录：', 'author_label': '作者：', 'explanation_label': '解释：',
+        'submit': '提交', 'close': '关闭', 'older': '更早',
+        'top': '最新', 'most_viewed': '最多浏览', 'views': '次浏览',
+        'languages': {'english': '英语', 'chinese': '中文', 'french': '法语',
+                      'german': '德语', 'spanish': '西班牙语', 'hindi': '印地语'},
+        'sections': ['爱情名言', '励志名言', '悲伤名言', '智慧名言', '人生名言', '成功名言',
+                     '爱情谚语', '励志谚语', '悲伤谚语', '智慧谚语', '人生谚语', '成功谚语'],
+    },
+    'french': {
+        'html_lang': 'fr', 'site_name': 'Citations et Proverbes',
+        'home': 'Accueil', 'quotes': 'Citations', 'proverbs': 'Proverbes', 'about': 'À propos',
+        'logout': 'Déconnexion', 'login': 'Connexion', 'categories': 'Catégories',
+        'quote_label': 'Citation :', 'author_label': 'Auteur :', 'explanation_label': 'Explication :',
+        'submit': 'Soumettre', 'close': 'Fermer', 'older': 'Plus anciens',
+        'top': 'Les plus récentes', 'most_viewed': 'Les plus vues', 'views': 'vues',
+        'languages': {'english': 'Anglais', 'chinese': 'Chinois', 'french': 'Français',
+                      'german': 'Allemand', 'spanish': 'Espagnol', 'hindi': 'Hindi'},
+        'sections': ["Citations d'amour", 'Citations inspirantes', 'Citations tristes', 'Citations de sagesse',
+                     'Citations sur la vie', 'Citations sur le succès',
+                     "Proverbes d'amour", 'Proverbes inspirants', 'Proverbes tristes', 'Proverbes de sagesse',
+                     'Proverbes sur la vie', 'Proverbes sur le succès'],
+    },
+    'german': {
+        'html_lang': 'de', 'site_name': 'Zitate und Sprichwörter',
+        'home': 'Startseite', 'quotes': 'Zitate', 'proverbs': 'Sprichwörter', 'about': 'Über uns',
+        'logout': 'Abmelden', 'login': 'Anmelden', 'categories': 'Kategorien',
+        'quote_label': 'Zitat:', 'author_label': 'Autor:', 'explanation_label': 'Erklärung:',
+        'submit': 'Absenden', 'close': 'Schließen', 'older': 'Ältere',
+        'top': 'Neueste', 'most_viewed': 'Meistgesehen', 'views': 'Aufrufe',
+        'languages': {'english': 'English', 'chinese': 'Chinesisch', 'french': 'Französisch',
+                      'german': 'Deutsch', 'spanish': 'Spanisch', 'hindi': 'Hindi'},
+        'sections': ['Liebeszitate', 'Motivationszitate', 'Traurige Zitate', 'Weisheiten', 'Lebenszitate', 'Erfolgszitate',
+                     'Liebessprichwörter', 'Motivationssprichwörter', 'Traurige Sprichwörter', 'Weisheitssprichwörter',
+                     'Lebensweisheiten', 'Erfolgssprichwörter'],
+    },
+    'spanish': {
+        'html_lang': 'es', 'site_name': 'Citas y Proverbios',
+        'home': 'Inicio', 'quotes': 'Citas', 'proverbs': 'Proverbios', 'about': 'Acerca de',
+        'logout': 'Cerrar sesión', 'login': 'Iniciar sesión', 'categories': 'Categorías',
+        'quote_label': 'Cita:', 'author_label': 'Autor:', 'explanation_label': 'Explicación:',
+        'submit': 'Enviar', 'close': 'Cerrar', 'older': 'Más antiguos',
+        'top': 'Más recientes', 'most_viewed': 'Más vistas', 'views': 'vistas',
+        'languages': {'english': 'Inglés', 'chinese': 'Chino', 'french': 'Francés',
+                      'german': 'Alemán', 'spanish': 'Español', 'hindi': 'Hindi'},
+        'sections': ['Citas de Amor', 'Citas de Motivación', 'Citas Tristes', 'Citas de Sabiduría', 'Citas de Vida',
+                     'Citas de Éxito', 'Proverbios de Amor', 'Proverbios de Motivación', 'Proverbios Tristes',
+                     'Proverbios de Sabiduría', 'Proverbios de Vida', 'Proverbios de Éxito'],
+    },
+    'hindi': {
+        'html_lang': 'hi', 'site_name': 'उद्धरण और कहावतें',
+        'home': 'मुखपृष्ठ', 'quotes': 'उद्धरण', 'proverbs': 'कहावतें', 'about': 'हमारे बारे में',
+        'logout': 'लॉग आउट', 'login': 'लॉग इन', 'categories': 'श्रेणियाँ',
+        'quote_label': 'कहावत:', 'author_label': 'लेखक:', 'explanation_label': 'व्याख्या:',
+        'submit': 'सबमिट करें', 'close': 'बंद करें', 'older': 'पुराने',
+        'top': 'नवीनतम', 'most_viewed': 'सबसे ज़्यादा देखे गए', 'views': 'बार देखा गया',
+        'languages': {'english': 'अँग्रेज़ी', 'chinese': 'चीनी', 'french': 'फ्रेंच',
+                      'german': 'जर्मन', 'spanish': 'स्पैनिश', 'hindi': 'हिन्दी'},
+        'sections': ['प्रेम उद्धरण', 'प्रेरणादायक उद्धरण', 'दुखद उद्धरण', 'ज्ञान उद्धरण', 'जीवन उद्धरण', 'सफलता उद्धरण',
+                     'प्रेम कहावतें', 'प्रेरणा कहावतें', 'दुखद कहावतें', 'ज्ञान कहावतें', 'जीवन कहावतें', 'सफलता कहावतें'],
+    },
+}
+
+SECTION_LABELS = {
+    section.name: UI_TEXT[section.language]['sections'][SIDEBAR_ORDER.index((section.category, section.kind))]
+    for section in SECTIONS.values()
+}
+SIDEBARS = {language: [category + language_code + KINDS_BY_NAME[kind] for category, kind in SIDEBAR_ORDER]
+            for language_code, language in LANGUAGES.items()}
+
+app.jinja_env.globals.update(language_pages=LANGUAGE_PAGES, about_pages=ABOUT_PAGES,
+                             section_labels=SECTION_LABELS, sidebars=SIDEBARS)
+
+SECTION_PAGE_SIZE = 20
+SECTION_PAGE_MAX = 100
+
+class SectionCache:
+    # LRU cache of section listings keyed by (section, before, limit). Each
+    # entry remembers the section version (see section_versions) it was read
+    # at and is only served to a reader that saw the same version, so a write
+    # or a counter flush handled by any process or worker makes it stale
+    # everywhere. Readers must read the version before the listing; a listing
+    # that raced with a write is then newer than its version, never older.
+    # Both the number of entries and the quotes they hold are bounded, the
+    # latter by SECTION_CACHE_ROWS, since an unpaginated listing holds its
+    # whole section; a listing larger than that is not cached at all.
+    # invalidate() just frees the entries of a section early.
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._rows = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stale': 0, 'evictions': 0, 'invalidations': 0, 'too_large': 0}
+
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] != version:
+                self._remove(key)
+                self._stats['stale'] += 1
+                entry = None
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry[1]
+
+    def put(self, key, version, value):
+        # value is a (quotes, next_before) pair.
+        rows = len(value[0])
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if rows > app.config['SECTION_CACHE_ROWS']:
+                self._stats['too_large'] += 1
+                return
+            self._entries[key] = (version, value)
+            self._rows += rows
+            while (len(self._entries) > app.config['SECTION_CACHE_SIZE']
+                   or self._rows > app.config['SECTION_CACHE_ROWS']):
+                self._remove(next(iter(self._entries)))
+                self._stats['evictions'] += 1
+
+    def _remove(self, key):
+        # Caller holds the lock.
+        self._rows -= len(self._entries.pop(key)[1][0])
+
+    def invalidate(self, section):
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == section]:
+                self._remove(key)
+            self._stats['invalidations'] += 1
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+            stats['rows'] = self._rows
+        stats['max_size'] = app.config['SECTION_CACHE_SIZE']
+        stats['max_rows'] = app.config['SECTION_CACHE_ROWS']
+        return stats
+
+section_cache = SectionCache()
+
+class CounterBuffer:
+    # View and like counts collected in memory per quote and written in one
+    # transaction every COUNTER_FLUSH_INTERVAL seconds, so page views never
+    # take SQLite's write lock. A crash loses at most one interval of counts.
+    # Flushing is left to the background task alone: once COUNTER_BUFFER_SIZE
+    # quotes are pending, counts for other quotes are dropped until the next
+    # flush rather than making a request wait for the write. A flush bumps the
+    # stats_version of the sections involved, so their listings and ETags
+    # pick up the new counts.
+
+    def __init__(self):
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._stats = {'flushes': 0, 'views': 0, 'likes': 0, 'dropped': 0, 'last_flush_ms': 0.0}
+
+    def add(self, quote_id, section_name, views=0, likes=0):
+        with self._lock:
+            counts = self._pending.get(quote_id)
+            if counts is None:
+                if len(self._pending) >= app.config['COUNTER_BUFFER_SIZE']:
+                    self._stats['dropped'] += 1
+                    return
+                counts = self._pending[quote_id] = [section_name, 0, 0]
+            counts[1] += views
+            counts[2] += likes
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        start = time.perf_counter()
+        conn = get_db_connection()
+        try:
+            # Counts for quotes deleted in the meantime are dropped by the
+            # SELECT instead of leaving orphan rows.
+            conn.executemany('INSERT INTO quote_stats (quote_id, views, likes) SELECT id, ?, ? FROM quotes WHERE id = ? '
+                             'ON CONFLICT (quote_id) DO UPDATE SET views = views + excluded.views, '
+                             'likes = likes + excluded.likes',
+                             [(views, likes, quote_id) for quote_id, (_, views, likes) in pending.items()])
+            now = int(time.time())
+            conn.executemany('INSERT INTO section_versions (section, version, stats_version, updated_at) '
+                             'VALUES (?, 0, 1, ?) ON CONFLICT (section) DO UPDATE SET '
+                             'stats_version = stats_version + 1, updated_at = excluded.updated_at',
+                             [(section_name, now) for section_name in set(counts[0] for counts in pending.values())])
+            conn.commit()
+        finally:
+            conn.close()
+        with self._lock:
+            self._stats['flushes'] += 1
+            self._stats['views'] += sum(counts[1] for counts in pending.values())
+            self._stats['likes'] += sum(counts[2] for counts in pending.values())
+            self._stats['last_flush_ms'] = round((time.perf_counter() - start) * 1000, 3)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pending'] = len(self._pending)
+        return stats
+
+counters = CounterBuffer()
+atexit.register(counters.flush)
+
+@background_task('COUNTER_FLUSH_INTERVAL')
+def flush_counters():
+    counters.flush()
+
+def count_views(section_name, quotes):
+    # Counts each quote as it is handed to the template; works for lists and
+    # for the lazily streamed cursor alike.
+    for quote in quotes:
+        counters.add(quote['id'], section_name, views=1)
+        yield quote
+
+def section_query(section_name, before=None, limit=None, since=None, until=None, by_timestamp=False):
+    # Counts come from the flushed quote_stats rows in the same query. Newest
+    # first by id, or by timestamp for time ranges, which are then read from
+    # idx_quotes_section_timestamp.
+    query = ('SELECT q.id, q.quote, q.author, q.explanation, q.timestamp, '
+             'COALESCE(s.views, 0) AS views, COALESCE(s.likes, 0) AS likes '
+             'FROM quotes q LEFT JOIN quote_stats s ON s.quote_id = q.id '
+             'WHERE q.category_id = ? AND q.kind_id = ? AND q.language_id = ? AND q.completed = 1')
+    params = list(SECTION_KEYS[section_name])
+    if before is not None:
+        query += ' AND q.id < ?'
+        params.append(before)
+    if since is not None:
+        query += ' AND q.timestamp >= ?'
+        params.append(since)
+    if until is not None:
+        query += ' AND q.timestamp < ?'
+        params.append(until)
+    query += ' ORDER BY q.timestamp DESC, q.id DESC' if by_timestamp else ' ORDER BY q.id DESC'
+    if limit is not None:
+        query += ' LIMIT ?'
+        params.append(limit)
+    return query, params
+
+def iter_section_quotes(section_name):
+    # Walks the whole section in STREAM_FETCH_SIZE batches so memory use does
+    # not depend on the section size. Bypasses the section cache. As in
+    # iter_export_rows(), each batch is its own short query keyed on the last
+    # id, on a connection of its own: a slow client then holds neither a read
+    # transaction (which blocks writers under the default journal and WAL
+    # checkpoints) nor a pooled connection.
+    conn = get_db_connection()
+    try:
+        before = None
+        while True:
+            rows = conn.execute(*section_query(section_name, before, app.config['STREAM_FETCH_SIZE'])).fetchall()
+            yield from rows
+            if len(rows) < app.config['STREAM_FETCH_SIZE']:
+                break
+            before = rows[-1]['id']
+    finally:
+        conn.close()
+
+def stream_section(template_name, **context):
+    # Jinja yields output as it renders, so the navbar and sidebar go out
+    # before the first quote is fetched.
+    app.update_template_context(context)
+    stream = app.jinja_env.get_template(template_name).stream(context)
+    stream.enable_buffering(app.config['STREAM_BUFFER_SIZE'])
+    return app.response_class(stream_with_context(stream))
+
+def fetch_section_quotes(section_name, before=None, limit=None, version=None):
+    # Returns (quotes, next_before). With no limit the whole section is
+    # returned and next_before is always None. Pass the section version if
+    # the caller has already read it.
+    if version is None:
+        version = get_section_versions([section_name])[section_name]
+    key = (section_name, before, limit)
+    cached = section_cache.get(key, version)
+    if cached is not None:
+        return cached
+    # Fetch one extra row to know whether an older page exists.
+    query, params = section_query(section_name, before, limit + 1 if limit is not None else None)
+    c = get_db().cursor()
+    c.execute(query, params)
+    quotes = c.fetchall()
+    next_before = None
+    if limit is not None and len(quotes) > limit:
+        quotes = quotes[:limit]
+        next_before = quotes[-1]['id']
+    result = (quotes, next_before)
+    section_cache.put(key, version, result)
+    return result
+
+def fetch_sections_quotes(section_names, limit):
+    # Batched form of fetch_section_quotes() for the first page of several
+    # sections: cache hits are served as usual and all misses are read with
+    # one UNION ALL query, each arm a bounded seek on the section index.
+    results = {}
+    misses = {}
+    versions = get_section_versions(section_names)
+    for section_name in section_names:
+        cached = section_cache.get((section_name, None, limit), versions[section_name])
+        if cached is not None:
+            results[section_name] = cached
+        else:
+            misses[section_name] = versions[section_name]
+    if misses:
+        queries = []
+        params = []
+        for section_name in misses:
+            query, query_params = section_query(section_name, limit=limit + 1)
+            queries.append('SELECT ? AS section, * FROM (%s)' % query)
+            params += [section_name] + query_params
+        c = get_db().cursor()
+        c.execute(' UNION ALL '.join(queries), params)
+        rows = {section_name: [] for section_name in misses}
+        for row in c.fetchall():
+            rows[row['section']].append(row)
+        for section_name, quotes in rows.items():
+            next_before = None
+            if len(quotes) > limit:
+                quotes = quotes[:limit]
+                next_before = quotes[-1]['id']
+            results[section_name] = (quotes, next_before)
+            section_cache.put((section_name, None, limit), misses[section_name], results[section_name])
+    return results
+
+def get_section_page(section_name, version):
+    # Listings are unpaginated unless ?before= or ?limit= is given. Pages are
+    # keyed on id rather than OFFSET so a deep page costs the same as the first.
+    before = request.args.get('before', type=sqlite_int)
+    limit = request.args.get('limit', type=int)
+    if before is not None or limit is not None:
+        limit = max(1, min(limit or SECTION_PAGE_SIZE, SECTION_PAGE_MAX))
+    quotes, next_before = fetch_section_quotes(section_name, before, limit, version)
+    next_url = None
+    if next_before is not None:
+        next_url = url_for(request.endpoint, **request.view_args, before=next_before, limit=limit)
+    return quotes, next_url
+
+# A section's version is the pair (version, stats_version): the first moves
+# with writes to the section, the second with flushed view and like counts.
+
+def get_section_version(section_name):
+    c = get_db().cursor()
+    c.execute('SELECT version, stats_version, updated_at FROM section_versions WHERE section = ?', (section_name,))
+    row = c.fetchone()
+    if row is None:
+        return (0, 0), None
+    return (row['version'], row['stats_version']), datetime.fromtimestamp(row['updated_at'], timezone.utc)
+
+def get_section_versions(section_names):
+    c = get_db().cursor()
+    c.execute('SELECT section, version, stats_version FROM section_versions WHERE section IN (%s)'
+              % ', '.join('?' * len(section_names)), list(section_names))
+    versions = dict.fromkeys(section_names, (0, 0))
+    versions.update((row['section'], (row['version'], row['stats_version'])) for row in c.fetchall())
+    return versions
+
+def bump_section_version(conn, section_name):
+    conn.execute('INSERT INTO section_versions (section, version, updated_at) VALUES (?, 1, ?) '
+                 'ON CONFLICT (section) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at',
+                 (section_name, int(time.time())))
+
+def commit_section_write(conn, section_name):
+    # Every write to a section goes through here: the version bump shares the
+    # write's transaction, which makes cached listings of the section stale in
+    # every process. This process also drops them right away.
+    bump_section_version(conn, section_name)
+    conn.commit()
+    section_cache.invalidate(section_name)
+
+def record_top_quote(c, quote_id):
+    # Called in the transaction that completes a quote. Each scope holds at
+    # most TOP_QUOTES_MAX rows, so trimming touches only a few rows.
+    c.execute('SELECT q.id, %s AS section, q.quote, q.author, q.explanation, q.timestamp FROM quotes q '
+              'WHERE q.id = ? AND q.completed = 1' % section_name_sql('q'), (quote_id,))
+    row = c.fetchone()
+    if row is None:
+        return
+    for scope in top_quote_scopes(SECTIONS[row['section']]):
+        c.execute('INSERT OR REPLACE INTO top_quotes (scope, timestamp, quote_id, section, quote, author, explanation) '
+                  'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                  (scope, row['timestamp'] or 0, row['id'], row['section'], row['quote'], row['author'],
+                   row['explanation']))
+        c.execute('DELETE FROM top_quotes WHERE scope = ? AND quote_id NOT IN '
+                  '(SELECT quote_id FROM top_quotes WHERE scope = ? ORDER BY timestamp DESC, quote_id DESC LIMIT ?)',
+                  (scope, scope, TOP_QUOTES_MAX))
+
+def insert_quote(c, section_name, quote, author, explanation):
+    c.execute('INSERT INTO quotes (quote, author, explanation, category_id, kind_id, language_id, completed, timestamp) '
+              'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+              (quote, author, explanation) + SECTION_KEYS[section_name] + (1, now_ms()))
+    quote_id = c.lastrowid
+    record_top_quote(c, quote_id)
+    return quote_id
+
+class WriteQueue:
+    # Optional group commit for quote submissions (WRITE_BEHIND). Submitters
+    # enqueue their row and wait; one writer thread per process drains the
+    # queue and commits up to WRITE_BATCH_SIZE rows, or whatever arrived
+    # within WRITE_BATCH_WINDOW ms, in a single transaction. The submitter is
+    # released only after its batch is committed, so the page it is
+    # redirected to already shows the new quote.
+
+    def __init__(self):
+        self._queue = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stats = {'batches': 0, 'rows': 0, 'errors': 0, 'last_batch_size': 0, 'last_commit_ms': 0.0}
+
+    def submit(self, section_name, quote, author, explanation):
+        future = Future()
+        self._ensure_writer().put((future, section_name, quote, author, explanation))
+        return future.result()
+
+    def _ensure_writer(self):
+        # The writer is started on first use and again in each forked worker,
+        # where the parent's thread no longer runs.
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._queue = queue.Queue(maxsize=app.config['WRITE_QUEUE_SIZE'])
+                self._thread = threading.Thread(target=self._run, args=(self._queue,), name='write_queue', daemon=True)
+                self._thread.start()
+            return self._queue
+
+    def _run(self, pending):
+        conn = get_db_connection()
+        while True:
+            batch = [pending.get()]
+            deadline = time.monotonic() + app.config['WRITE_BATCH_WINDOW'] / 1000.0
+            while len(batch) < app.config['WRITE_BATCH_SIZE']:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(pending.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            self._commit(conn, batch)
+
+    def _commit(self, conn, batch):
+        start = time.perf_counter()
+        try:
+            c = conn.cursor()
+            quote_ids = [insert_quote(c, *item[1:]) for item in batch]
+            section_names = set(item[1] for item in batch)
+            for section_name in section_names:
+                bump_section_version(conn, section_name)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            app.logger.exception('Group commit of %d quotes failed', len(batch))
+            with self._lock:
+                self._stats['errors'] += 1
+            for item in batch:
+                item[0].set_exception(e)
+            return
+        for section_name in section_names:
+            section_cache.invalidate(section_name)
+        with self._lock:
+            self._stats['batches'] += 1
+            self._stats['rows'] += len(batch)
+            self._stats['last_batch_size'] = len(batch)
+            self._stats['last_commit_ms'] = round((time.perf_counter() - start) * 1000, 3)
+        for item, quote_id in zip(batch, quote_ids):
+            item[0].set_result(quote_id)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['depth'] = self._queue.qsize() if self._queue is not None else 0
+        stats['max_depth'] = app.config['WRITE_QUEUE_SIZE']
+        return stats
+
+write_queue = WriteQueue()
+
+def normalize_text(value):
+    # Stored text is NFC so that precomposed and combining spellings of the
+    # same word (common in Devanagari and accented Latin) index identically.
+    if value is None:
+        return None
+    return unicodedata.normalize('NFC', value)
+
+def compute_build_id():
+    # Digest of the code and templates, the same in every process running a
+    # given deploy. Section ETags include it so that a deploy that changes
+    # markup is not answered with a 304 for pages nobody has written to.
+    digest = hashlib.sha1()
+    with open(__file__, 'rb') as f:
+        digest.update(f.read())
+    template_dir = os.path.join(app.root_path, app.template_folder)
+    for name in sorted(os.listdir(template_dir)):
+        with open(os.path.join(template_dir, name), 'rb') as f:
+            digest.update(name.encode() + b'\0' + f.read())
+    return digest.hexdigest()
+
+BUILD_ID = compute_build_id()
+
+def render_section(section_name, template_name, **context):
+    # The ETag is derived from the section version and BUILD_ID alone, so a
+    # matching conditional GET is answered with a 304 before the listing is
+    # queried. It is weak because a listing read just after the version may
+    # already include a newer write or count. If-Modified-Since is not
+    # honoured: HTTP dates have whole seconds, so a write in the same second
+    # as the client's copy would go unnoticed.
+    version, last_modified = get_section_version(section_name)
+    # The navbar shows a login or logout link, so the session matters too.
+    etag = hashlib.sha1(('%s|%s|%s|%d.%d|%d' % ((BUILD_ID, template_name, request.full_path) + version
+                                                + ('user_id' in session,))).encode()).hexdigest()
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    elif app.config['STREAM_SECTIONS'] and 'before' not in request.args and 'limit' not in request.args:
+        response = stream_section(template_name, quotes=count_views(section_name, iter_section_quotes(section_name)),
+                                  next_url=None, **context)
+    else:
+        quotes, next_url = get_section_page(section_name, version)
+        response = make_response(render_template(template_name, quotes=count_views(section_name, quotes),
+                                                 next_url=next_url, **context))
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    response.cache_control.no_cache = True
+    return response
+
+def get_quote_section(c, quote_id):
+    c.execute('SELECT category_id, kind_id, language_id FROM quotes WHERE id = ?', (quote_id,))
+    row = c.fetchone()
+    return SECTIONS_BY_KEY.get(tuple(row)) if row else None
+
 @app.route('/home')
 @login_required
 def home():
@@ -119,1971 +1411,772 @@ def home():
 
 @app.route('/section/<section_name>')
 def section_home(section_name):
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', (section_name,))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('home.html', quotes=quotes, section=section_name)
+    if section_name not in SECTIONS:
+        abort(404)
+    return render_section(section_name, 'home.html', section=section_name)
 
 
 @app.route('/create_draft/<section_name>')
 def create_draft(section_name):
-    conn = get_db_connection()
+    # A draft only reserves an id for the quote form; it expires after
+    # DRAFT_TTL seconds unless submitted or cancelled first.
+    if section_name not in SECTIONS:
+        abort(404)
+    now = int(time.time())
+    conn = get_db()
     c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section) VALUES (?, ?, ?, ?)', ("", "", "", section_name))
+    c.execute('INSERT INTO drafts (section, created_at, expires_at) VALUES (?, ?, ?)',
+              (section_name, now, now + app.config['DRAFT_TTL']))
     conn.commit()
     draft_id = c.lastrowid
-    conn.close()
     return redirect(url_for('new_quote', section_name=section_name, draft_id=draft_id))
 
 @app.route('/new/<section_name>')
 def new_quote(section_name):
     draft_id = request.args.get('draft_id')
-    return render_template('index.html', section=section_name, draft_id=draft_id)
-
-@app.route('/submitloveq_form', methods=['POST'])
-def submitloveq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'loveq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('loveq'))
-
-@app.route('/submitlovep_form', methods=['POST'])
-def submitlovep_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lovep', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lovep'))
-
-@app.route('/submitlifep_form', methods=['POST'])
-def submitlifep_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lifep', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lifep'))
-
-@app.route('/submitlifeq_form', methods=['POST'])
-def submitlifeq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lifeq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lifeq'))
-
-@app.route('/submitwisdomq_form', methods=['POST'])
-def submitwisdomq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'wisdomq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('wisdomq'))
-
-@app.route('/submitsadq_form', methods=['POST'])
-def submitsadq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'sadq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('sadq'))
-
-@app.route('/submitmotivationq_form', methods=['POST'])
-def submitmotivationq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'motivationq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('motivationq'))
-
-@app.route('/submitsuccessq_form', methods=['POST'])
-def submitsuccessq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'successq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('successq'))
-
-@app.route('/submitwisdomp_form', methods=['POST'])
-def submitwisdomp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'wisdomp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('wisdomp'))
-
-@app.route('/submitsadp_form', methods=['POST'])
-def submitsadp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'sadp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('sadp'))
-
-@app.route('/submitmotivationp_form', methods=['POST'])
-def submitmotivationp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'motivationp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('motivationp'))
-
-@app.route('/submitsuccessp_form', methods=['POST'])
-def submitsuccessp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'successp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('successp'))
-
-#french
-@app.route('/submitlovefq_form', methods=['POST'])
-def submitlovefq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lovefq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lovefq'))
-
-@app.route('/submitlovefp_form', methods=['POST'])
-def submitlovefp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lovefp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lovefp'))
-
-@app.route('/submitlifefp_form', methods=['POST'])
-def submitlifefp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lifefp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lifefp'))
+    return render_template('quoteform.html', section=section_name, draft_id=draft_id)
 
-@app.route('/submitlifefq_form', methods=['POST'])
-def submitlifefq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
 
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lifefq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lifefq'))
-
-@app.route('/submitwisdomfq_form', methods=['POST'])
-def submitwisdomfq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'wisdomfq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('wisdomfq'))
-
-@app.route('/submitsadfq_form', methods=['POST'])
-def submitsadfq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
+@app.route('/submit', methods=['POST'])
+def submit():
+    # The draft's section wins over the form field. A draft that has already
+    # been swept does not lose the user's text: the form's section is used.
+    draft_id = request.form.get('draft_id', type=sqlite_int)
+    quote = normalize_text(request.form.get('quote'))
+    author = normalize_text(request.form.get('author'))
+    explanation = normalize_text(request.form.get('explanation'))
+    conn = get_db()
+    c = conn.cursor()
+    c.execute('SELECT section FROM drafts WHERE id = ?', (draft_id,))
+    row = c.fetchone()
+    section = row['section'] if row else request.form.get('section')
+    if section not in SECTIONS or not quote or not author:
+        abort(400)
+    insert_quote(c, section, quote, author, explanation or '')
+    c.execute('DELETE FROM drafts WHERE id = ?', (draft_id,))
+    commit_section_write(conn, section)
+    return redirect(url_for('section_home', section_name=section))
 
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'sadfq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+# One list view and one submit view serve every section. Each section keeps
+# its historical URL and endpoint name ('/loveq' as 'loveq', '/submitloveq_form'
+# as 'submitloveq_form') as an alias rule pointing at the shared view.
+
+def section_view(section_name):
+    section = SECTIONS[section_name]
+    return render_section(section_name, 'section.html', section=section,
+                          language=section.language, ui=UI_TEXT[section.language])
+
+@app.route('/submit/<section_name>', methods=['POST'], endpoint='submit_form')
+def submit_section_form(section_name):
+    if section_name not in SECTIONS:
+        abort(404)
+    quote = normalize_text(request.form['quote'])
+    author = normalize_text(request.form['author'])
+    explanation = normalize_text(request.form['explanation'])
+    if app.config['WRITE_BEHIND']:
+        write_queue.submit(section_name, quote, author, explanation)
+    else:
+        conn = get_db()
+        insert_quote(conn.cursor(), section_name, quote, author, explanation)
+        commit_section_write(conn, section_name)
+    return redirect(url_for(section_name))
+
+def register_section_aliases():
+    for name in SECTIONS:
+        app.add_url_rule('/' + name, endpoint=name, view_func=section_view,
+                         defaults={'section_name': name})
+        app.add_url_rule('/submit%s_form' % name, endpoint='submit%s_form' % name, view_func=submit_section_form,
+                         methods=['POST'], defaults={'section_name': name})
+
+register_section_aliases()
+
+
+@app.route('/cancel/<id:draft_id>/<section_name>')
+def cancel(draft_id, section_name):
+    if section_name not in SECTIONS:
+        abort(404)
+    conn = get_db()
+    conn.execute('DELETE FROM drafts WHERE id = ?', (draft_id,))
     conn.commit()
-    conn.close()
-
-    return redirect(url_for('sadfq'))
+    return redirect(url_for('section_home', section_name=section_name))
 
-@app.route('/submitmotivationfq_form', methods=['POST'])
-def submitmotivationfq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
+@app.route('/like/<id:quote_id>', methods=['POST'])
+def like(quote_id):
+    c = get_db().cursor()
+    section_name = get_quote_section(c, quote_id)
+    if section_name is None:
+        abort(404)
+    counters.add(quote_id, section_name, likes=1)
+    return redirect(request.referrer or url_for(section_name))
+
+def quote_json(row):
+    # A section_query() row as returned by the JSON API.
+    return {'id': row['id'], 'quote': row['quote'], 'author': row['author'], 'explanation': row['explanation'],
+            'timestamp': row['timestamp'], 'views': row['views'], 'likes': row['likes']}
+
+@app.route('/api/quotes')
+def api_quotes():
+    section_names = list(dict.fromkeys(name for name in request.args.get('sections', '').split(',') if name))
+    unknown = [name for name in section_names if name not in SECTIONS]
+    if not section_names or unknown:
+        return jsonify(error='unknown or missing sections', sections=unknown), 400
+    limit = max(1, min(request.args.get('limit', SECTION_PAGE_SIZE, type=int), SECTION_PAGE_MAX))
+    results = fetch_sections_quotes(section_names, limit)
+    return jsonify(sections={
+        section_name: {
+            'quotes': [quote_json(row) for row in quotes],
+            'next_before': next_before,
+        }
+        for section_name, (quotes, next_before) in results.items()
+    })
+
+def fetch_quotes_in_range(section_name, since=None, until=None, limit=SECTION_PAGE_SIZE):
+    # Newest first within [since, until). Returns (quotes, more).
+    c = get_db().cursor()
+    c.execute(*section_query(section_name, limit=limit + 1, since=since, until=until, by_timestamp=True))
+    quotes = c.fetchall()
+    return quotes[:limit], len(quotes) > limit
+
+@app.route('/api/quotes/range')
+def api_quotes_range():
+    # e.g. /api/quotes/range?section=wisdomhq&days=7 for the last week, or
+    # since/until as ISO 8601 dates (UTC) or epoch milliseconds.
+    section_name = request.args.get('section')
+    if section_name not in SECTIONS:
+        return jsonify(error='unknown or missing section'), 400
+    try:
+        since, until = parse_time_range(request.args.get('since'), request.args.get('until'))
+    except ValueError:
+        return jsonify(error='since and until must be ISO 8601 dates or epoch milliseconds'), 400
+    days = request.args.get('days', type=float)
+    if days is not None:
+        try:
+            if not math.isfinite(days):
+                raise ValueError(days)
+            since = parse_timestamp(now_ms() - int(days * 86400000))
+        except ValueError:
+            return jsonify(error='days must be a finite number within the timestamp range'), 400
+    limit = max(1, min(request.args.get('limit', SECTION_PAGE_SIZE, type=int), SECTION_PAGE_MAX))
+    quotes, more = fetch_quotes_in_range(section_name, since, until, limit)
+    return jsonify(section=section_name, since=since, until=until, more=more,
+                   quotes=[quote_json(row) for row in quotes])
+
+# Search
+
+SEARCH_TERM = re.compile(r'[\w%s]+\*?' % re.escape(DEVANAGARI_MARKS))
+TRIGRAM_LENGTH = 3
+CJK_CHARACTERS = re.compile('[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]')
+
+# Light suffix stripping for the languages whose words inflect at the end.
+# SQLite ships no stemmer, so the stem becomes a prefix query instead
+# ('amours' -> "amour"*). Suffixes are written without accents because they
+# are matched against the folded word; longer suffixes come first.
+STEM_SUFFIXES = {
+    'french': ('issements', 'issement', 'atrices', 'ateurs', 'ations', 'atrice', 'ateur', 'ation',
+               'ements', 'ement', 'euses', 'euse', 'ites', 'ite', 'ives', 'ive', 'eux',
+               'ees', 'ee', 'es', 'er', 'ez', 'if', 'e', 's'),
+    'spanish': ('amientos', 'imientos', 'amiento', 'imiento', 'aciones', 'adoras', 'adores',
+                'idades', 'ancias', 'adora', 'acion', 'ancia', 'mente', 'ables', 'ibles',
+                'istas', 'idad', 'able', 'ible', 'ista', 'ador', 'osos', 'osas', 'oso', 'osa',
+                'es', 'os', 'as', 'a', 'o', 'e', 's'),
+    'german': ('heiten', 'keiten', 'lichen', 'ungen', 'liche', 'heit', 'keit', 'lich', 'isch',
+               'ung', 'ern', 'em', 'en', 'er', 'es', 'e', 's', 'n'),
+}
+STEM_MIN_LENGTH = 4
+
+def fold_diacritics(word):
+    return ''.join(ch for ch in unicodedata.normalize('NFD', word) if not unicodedata.combining(ch))
+
+def stem(word, language):
+    word = fold_diacritics(word.lower())
+    for suffix in STEM_SUFFIXES[language]:
+        if word.endswith(suffix) and len(word) - len(suffix) >= STEM_MIN_LENGTH:
+            return word[:-len(suffix)]
+    return word
+
+def build_match_query(text, language=None):
+    # Every word must match; quoting keeps user input from being parsed as
+    # FTS5 syntax. A trailing '*' on a word makes it a prefix query.
+    terms = []
+    for term in SEARCH_TERM.findall(normalize_text(text)):
+        word = term.rstrip('*')
+        prefix = term.endswith('*')
+        if language in STEM_SUFFIXES:
+            # The index holds inflected words, so a stem long enough to be
+            # selective is looked up as a prefix ('amour' finds 'amours').
+            word = stem(word, language)
+            prefix = prefix or len(word) >= STEM_MIN_LENGTH
+        terms.append('"%s"%s' % (word, '*' if prefix else ''))
+    return ' '.join(terms)
+
+def search_index(index, match, section_names, limit):
+    # Matches in the quote itself rank above author, then explanation.
+    if section_names is None:
+        # Rank and limit inside FTS5 first so only the top rows are joined.
+        # Drafts live in their own table and every quotes row is completed,
+        # so filtering on completed afterwards does not shrink the page.
+        query = '''SELECT q.id, %s AS section, q.quote, q.author, q.explanation, q.timestamp, f.score
+                   FROM (SELECT rowid, bm25(%s, 10.0, 5.0, 1.0) AS score FROM %s
+                         WHERE %s MATCH ? ORDER BY score LIMIT ?) AS f
+                   JOIN quotes q ON q.id = f.rowid
+                   WHERE q.completed = 1 ORDER BY f.score''' % (section_name_sql('q'), index, index, index)
+        params = [match, limit]
+    else:
+        condition, params = sections_condition('q', section_names)
+        query = '''SELECT q.id, %s AS section, q.quote, q.author, q.explanation, q.timestamp,
+                          bm25(%s, 10.0, 5.0, 1.0) AS score
+                   FROM %s JOIN quotes q ON q.id = %s.rowid
+                   WHERE %s MATCH ? AND q.completed = 1 AND %s
+                   ORDER BY score LIMIT ?''' % (section_name_sql('q'), index, index, index, index, condition)
+        params = [match] + params + [limit]
+    c = get_db().cursor()
+    c.execute(query, params)
+    return c.fetchall()
+
+def search_chinese(text, section_names, limit):
+    # The trigram index can only look up runs of three or more characters;
+    # shorter queries (most single Chinese words) scan the Chinese sections
+    # with LIKE instead, newest first.
+    words = SEARCH_TERM.findall(normalize_text(text).replace('*', ''))
+    if not words:
+        return []
+    section_names = section_names or CHINESE_SECTIONS
+    if min(len(word) for word in words) >= TRIGRAM_LENGTH:
+        match = ' '.join('"%s"' % word for word in words)
+        return search_index('quotes_fts_cjk', match, section_names, limit)
+    condition = ' AND '.join(['(quote LIKE ? OR author LIKE ? OR explanation LIKE ?)'] * len(words))
+    params = []
+    for word in words:
+        params.extend(['%' + word.replace('%', '').replace('_', '') + '%'] * 3)
+    sections, section_params = sections_condition('q', section_names)
+    c = get_db().cursor()
+    c.execute('''SELECT q.id, %s AS section, q.quote, q.author, q.explanation, q.timestamp, 0.0 AS score
+                 FROM quotes q WHERE q.completed = 1 AND %s AND %s
+                 ORDER BY q.id DESC LIMIT ?''' % (section_name_sql('q'), sections, condition),
+              section_params + params + [limit])
+    return c.fetchall()
+
+def search_quotes(text, section_names=None, language=None, limit=SECTION_PAGE_SIZE):
+    # Each language is searched in the index built for it. Without a language
+    # both indexes are searched and merged by score.
+    # Without a language, the Chinese side is only searched when the query has
+    # CJK characters; a short Latin word would otherwise fall back to a LIKE
+    # scan of every Chinese section.
+    rows = []
+    if language == 'chinese' or (language is None and CJK_CHARACTERS.search(text)):
+        rows.extend(search_chinese(text, section_names, limit))
+    if language != 'chinese':
+        match = build_match_query(text, language)
+        if match:
+            rows.extend(search_index('quotes_fts', match, section_names, limit))
+    if language is None:
+        rows.sort(key=lambda row: row['score'])
+    return rows[:limit]
+
+@app.route('/search')
+def search():
+    if not search_available:
+        return jsonify(error='search is not available'), 503
+    section_names = None
+    section_name = request.args.get('section')
+    language = request.args.get('language')
+    if section_name:
+        if section_name not in SECTIONS:
+            return jsonify(error='unknown section'), 400
+        section_names = [section_name]
+        language = SECTIONS[section_name].language
+    elif language:
+        if language not in UI_TEXT:
+            return jsonify(error='unknown language'), 400
+        section_names = [section.name for section in SECTIONS.values() if section.language == language]
+    limit = max(1, min(request.args.get('limit', SECTION_PAGE_SIZE, type=int), SECTION_PAGE_MAX))
+    rows = search_quotes(request.args.get('q', ''), section_names, language or None, limit)
+    return jsonify(results=[{'id': row['id'], 'section': row['section'], 'quote': row['quote'],
+                             'author': row['author'], 'explanation': row['explanation'],
+                             'timestamp': row['timestamp']} for row in rows])
+
+def database_stats():
+    # Free pages are left behind by deletes (swept drafts, cancelled quotes)
+    # and are reused by later inserts; a high free_ratio means VACUUM would
+    # shrink the file.
+    c = get_db().cursor()
+    page_size = c.execute('PRAGMA page_size').fetchone()[0]
+    page_count = c.execute('PRAGMA page_count').fetchone()[0]
+    freelist_count = c.execute('PRAGMA freelist_count').fetchone()[0]
+    drafts = c.execute('SELECT count(*) FROM drafts').fetchone()[0]
+    return {'page_size': page_size, 'page_count': page_count, 'freelist_count': freelist_count,
+            'free_ratio': round(freelist_count / page_count, 4) if page_count else 0.0,
+            'drafts': drafts, 'draft_sweeps': dict(draft_sweeps)}
+
+@app.route('/stats')
+def stats():
+    return jsonify(db_pool=db_pool.stats(), section_cache=section_cache.stats(), counters=counters.stats(),
+                   write_queue=write_queue.stats(), database=database_stats(), login=password_checker.stats())
+
+def render_top_quotes(scope, language, heading):
+    limit = max(1, min(request.args.get('limit', TOP_QUOTES_SIZE, type=int), TOP_QUOTES_MAX))
+    c = get_db().cursor()
+    c.execute('SELECT quote_id AS id, section, quote, author, explanation, timestamp FROM top_quotes '
+              'WHERE scope = ? ORDER BY timestamp DESC, quote_id DESC LIMIT ?', (scope, limit))
+    return render_template('top.html', quotes=c.fetchall(), heading=heading,
+                           language=language, ui=UI_TEXT[language])
 
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'motivationfq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
+@app.route('/top')
+def top_quotes():
+    return render_top_quotes('all', 'english', UI_TEXT['english']['top'])
+
+@app.route('/top/viewed')
+def most_viewed_quotes():
+    limit = max(1, min(request.args.get('limit', TOP_QUOTES_SIZE, type=int), TOP_QUOTES_MAX))
+    c = get_db().cursor()
+    c.execute('''SELECT q.id, %s AS section, q.quote, q.author, q.explanation, q.timestamp
+                 FROM quote_stats s JOIN quotes q ON q.id = s.quote_id
+                 WHERE q.completed = 1 ORDER BY s.views DESC LIMIT ?''' % section_name_sql('q'), (limit,))
+    return render_template('top.html', quotes=c.fetchall(), heading=UI_TEXT['english']['most_viewed'],
+                           language='english', ui=UI_TEXT['english'])
+
+@app.route('/top/language/<language>')
+def top_quotes_by_language(language):
+    if language not in UI_TEXT:
+        abort(404)
+    return render_top_quotes('language:' + language, language, UI_TEXT[language]['top'])
+
+@app.route('/top/category/<category>')
+def top_quotes_by_category(category):
+    if category not in CATEGORIES:
+        abort(404)
+    return render_top_quotes('category:' + category, 'english',
+                             '%s: %s' % (UI_TEXT['english']['top'], category.capitalize()))
+
+# Listings across sections: one category and kind in every language (all
+# love proverbs), or one language and kind in every category. Each is a
+# single range scan of its own index, paged by id like section listings.
+KIND_PLURALS = {kind + 's': kind for kind in KINDS.values()}
+
+def render_quote_list(condition, params, heading, language):
+    before = request.args.get('before', type=sqlite_int)
+    limit = max(1, min(request.args.get('limit', SECTION_PAGE_SIZE, type=int), SECTION_PAGE_MAX))
+    query = ('SELECT q.id, %s AS section, q.quote, q.author, q.explanation, q.timestamp FROM quotes q '
+             'WHERE %s AND q.completed = 1' % (section_name_sql('q'), condition))
+    if before is not None:
+        query += ' AND q.id < ?'
+        params = params + [before]
+    query += ' ORDER BY q.id DESC LIMIT ?'
+    c = get_db().cursor()
+    c.execute(query, params + [limit + 1])
+    quotes = c.fetchall()
+    next_url = None
+    if len(quotes) > limit:
+        quotes = quotes[:limit]
+        next_url = url_for(request.endpoint, **request.view_args, before=quotes[-1]['id'], limit=limit)
+    return render_template('top.html', quotes=quotes, heading=heading, next_url=next_url,
+                           language=language, ui=UI_TEXT[language])
+
+@app.route('/category/<category>/<kinds>')
+def category_quotes(category, kinds):
+    if category not in CATEGORY_IDS or kinds not in KIND_PLURALS:
+        abort(404)
+    kind = KIND_PLURALS[kinds]
+    heading = UI_TEXT['english']['sections'][SIDEBAR_ORDER.index((category, kind))]
+    return render_quote_list('q.category_id = ? AND q.kind_id = ?', [CATEGORY_IDS[category], KIND_IDS[kind]],
+                             heading, 'english')
+
+@app.route('/language/<language>/<kinds>')
+def language_quotes(language, kinds):
+    if language not in LANGUAGE_IDS or kinds not in KIND_PLURALS:
+        abort(404)
+    kind = KIND_PLURALS[kinds]
+    ui = UI_TEXT[language]
+    return render_quote_list('q.language_id = ? AND q.kind_id = ?', [LANGUAGE_IDS[language], KIND_IDS[kind]],
+                             '%s: %s' % (ui['languages'][language], ui[kinds]), language)
+
+# Export
+
+EXPORT_COLUMNS = ('id', 'section', 'quote', 'author', 'explanation', 'timestamp')
+EXPORT_FORMATS = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+
+def iter_export_rows(conn, section_names=None, since=None, until=None):
+    # Completed quotes in id order, read in STREAM_FETCH_SIZE chunks. Each
+    # chunk is its own short query keyed on the last id, so a long export
+    # never holds a read transaction open and cannot stall WAL checkpoints.
+    conditions = ['q.completed = 1', 'q.id > ?']
+    params = []
+    if section_names is not None:
+        condition, section_params = sections_condition('q', section_names)
+        conditions.append(condition)
+        params += section_params
+    if since is not None:
+        conditions.append('q.timestamp >= ?')
+        params.append(since)
+    if until is not None:
+        conditions.append('q.timestamp < ?')
+        params.append(until)
+    columns = ['%s AS section' % section_name_sql('q') if column == 'section' else 'q.' + column
+               for column in EXPORT_COLUMNS]
+    query = 'SELECT %s FROM quotes q WHERE %s ORDER BY q.id LIMIT ?' % (', '.join(columns), ' AND '.join(conditions))
+    last_id = 0
+    while True:
+        rows = conn.execute(query, [last_id] + params + [app.config['STREAM_FETCH_SIZE']]).fetchall()
+        if not rows:
+            break
+        yield from rows
+        last_id = rows[-1]['id']
+
+def stream_export_rows(section_names=None, since=None, until=None):
+    # iter_export_rows() on a connection of its own, closed when the download
+    # ends or is abandoned. A pooled connection would stay checked out for as
+    # long as the client takes to read, and a few slow downloads would leave
+    # every other request waiting for one.
+    conn = get_db_connection()
+    try:
+        yield from iter_export_rows(conn, section_names, since, until)
+    finally:
+        conn.close()
 
-    return redirect(url_for('motivationfq'))
+def format_export(rows, fmt):
+    # Yields text chunks, one per row for NDJSON and per fetch-sized group
+    # for CSV.
+    if fmt == 'ndjson':
+        for row in rows:
+            yield json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + '\n'
+        return
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for n, row in enumerate(rows, 1):
+        writer.writerow(tuple(row))
+        if n % app.config['STREAM_FETCH_SIZE'] == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def gzip_export(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+def export_section_names(section_name=None, language=None):
+    # Returns the section filter for a section or language name, None for
+    # no filter; raises KeyError for unknown names.
+    if section_name:
+        if section_name not in SECTIONS:
+            raise KeyError(section_name)
+        return [section_name]
+    if language:
+        if language not in UI_TEXT:
+            raise KeyError(language)
+        return [section.name for section in SECTIONS.values() if section.language == language]
+    return None
+
+@app.route('/export')
+def export():
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify(error='unknown format'), 400
+    try:
+        section_names = export_section_names(request.args.get('section'), request.args.get('language'))
+    except KeyError:
+        return jsonify(error='unknown section or language'), 400
+    try:
+        since, until = parse_time_range(request.args.get('since'), request.args.get('until'))
+    except ValueError:
+        return jsonify(error='since and until must be ISO 8601 dates or epoch milliseconds'), 400
+    body = format_export(stream_export_rows(section_names, since, until), fmt)
+    # Accept-Encoding: gzip;q=0 explicitly refuses gzip.
+    compress = request.accept_encodings['gzip'] > 0
+    if compress:
+        body = gzip_export(body)
+    response = app.response_class(stream_with_context(body), mimetype=EXPORT_FORMATS[fmt])
+    if compress:
+        response.content_encoding = 'gzip'
+    response.headers['Content-Disposition'] = 'attachment; filename=quotes.%s' % fmt
+    response.vary.add('Accept-Encoding')
+    return response
+
+# Page Caching
+
+# Pages without per-request data are rendered once and served from memory.
+# Anything that depends on the session goes through late_fragment(), which
+# leaves a hole in the cached page that is filled with a small template on
+# every request.
+LATE_FRAGMENTS = {
+    'user_nav': 'user_nav.html',
+}
+FRAGMENT_SENTINEL = '\x00'
+page_cache = {}
+
+@app.template_global()
+def late_fragment(name, **context):
+    fragments = g.get('late_fragments')
+    if fragments is None:
+        return Markup(render_template(LATE_FRAGMENTS[name], **context))
+    fragments.append((name, context))
+    return Markup(FRAGMENT_SENTINEL)
+
+def render_cached_page(template_name):
+    page = page_cache.get(template_name)
+    if page is None:
+        g.late_fragments = []
+        try:
+            html = render_template(template_name)
+        finally:
+            fragments = g.pop('late_fragments')
+        page = (html.split(FRAGMENT_SENTINEL), fragments)
+        # Templates reload on change in debug mode; don't pin a stale copy.
+        if not app.jinja_env.auto_reload:
+            page_cache[template_name] = page
+    parts, fragments = page
+    html = [parts[0]]
+    for (name, context), part in zip(fragments, parts[1:]):
+        html.append(render_template(LATE_FRAGMENTS[name], **context))
+        html.append(part)
+    return ''.join(html)
 
-@app.route('/submitsuccessfq_form', methods=['POST'])
-def submitsuccessfq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
+@app.route('/quotes')
+def quotes():
+    return render_cached_page('quotes.html')
 
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'successfq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
+@app.route('/proverbs')
+def proverbs():
+    return render_cached_page('proverbs.html')
 
-    return redirect(url_for('successfq'))
+@app.route('/spanish')
+def spanish():
+    return render_cached_page('spanish.html')
 
-@app.route('/submitwisdomfp_form', methods=['POST'])
-def submitwisdomfp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
+@app.route('/hindi')
+def hindi():
+    return render_cached_page('hindi.html')
 
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'wisdomfp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
+@app.route('/german')
+def german():
+    return render_cached_page('german.html')
 
-    return redirect(url_for('wisdomfp'))
+@app.route('/chinese')
+def chinese():
+    return render_cached_page('chinese.html')
 
-@app.route('/submitsadfp_form', methods=['POST'])
-def submitsadfp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
 
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'sadfp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
+@app.route('/french')
+def french():
+    return render_cached_page('french.html')
 
-    return redirect(url_for('sadfp'))
 
-@app.route('/submitmotivationfp_form', methods=['POST'])
-def submitmotivationfp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
+@app.route('/about')
+def about():
+    return render_cached_page('about.html')
 
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'motivationfp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
+@app.route('/habout')
+def habout():
+    return render_cached_page('habout.html')
 
-    return redirect(url_for('motivationfp'))
+@app.route('/sabout')
+def sabout():
+    return render_cached_page('sabout.html')
 
-@app.route('/submitsuccessfp_form', methods=['POST'])
-def submitsuccessfp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
+@app.route('/gabout')
+def gabout():
+    return render_cached_page('gabout.html')
 
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'successfp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
+@app.route('/cabout')
+def cabout():
+    return render_cached_page('cabout.html')
 
-    return redirect(url_for('successfp'))
-#french
-#chinese
-@app.route('/submitlovecq_form', methods=['POST'])
-def submitlovecq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
+@app.route('/fabout')
+def fabout():
+    return render_cached_page('fabout.html')
 
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lovecq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
+# Command Line
 
-    return redirect(url_for('lovecq'))
+quotes_cli = AppGroup('quotes', help='Manage the quotes database.')
+app.cli.add_command(quotes_cli)
 
-@app.route('/submitlovecp_form', methods=['POST'])
-def submitlovecp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
+IMPORT_FIELDS = ('quote', 'author', 'explanation')
 
-    # Save to DB with section='loveq'
+def read_import_records(path, fmt):
+    # Yields (line number, record) pairs; a record that cannot be parsed is
+    # yielded as None so it is reported like any other invalid row.
+    with open(path, newline='', encoding='utf-8') as f:
+        if fmt == 'csv':
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield reader.line_num, record
+        else:
+            for line_num, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                yield line_num, record if isinstance(record, dict) else None
+
+def validate_import_record(record, default_timestamp):
+    if record is None:
+        return None, 'not a valid record'
+    section_name = record.get('section')
+    if section_name not in SECTIONS:
+        return None, 'unknown section %r' % (section_name,)
+    values = []
+    for field in IMPORT_FIELDS:
+        value = record.get(field)
+        if not isinstance(value, str) or not value.strip():
+            return None, 'missing %s' % field
+        values.append(normalize_text(value))
+    timestamp = record.get('timestamp')
+    if timestamp is None or timestamp == '':
+        return tuple(values) + (section_name, default_timestamp), None
+    try:
+        return tuple(values) + (section_name, parse_timestamp(timestamp)), None
+    except ValueError:
+        return None, 'invalid timestamp %r' % (timestamp,)
+
+def import_quotes(records, batch_size=10000, defer_indexes=True):
+    # Rows are inserted with one prepared statement per batch and one
+    # transaction per batch. With defer_indexes the secondary indexes and the
+    # search triggers are dropped first and rebuilt in bulk at the end, which
+    # is much faster than updating them row by row; readers should not be
+    # using the database meanwhile. Returns (imported, skipped) where skipped
+    # lists (line number, reason).
+    default_timestamp = now_ms()
+    imported = 0
+    skipped = []
+    section_names = set()
+    conn = get_db_connection()
+    try:
+        if defer_indexes:
+            for index in QUOTE_INDEXES:
+                conn.execute('DROP INDEX IF EXISTS %s' % index)
+            for index in SEARCH_INDEXES:
+                conn.execute('DROP TRIGGER IF EXISTS %s_insert' % index)
+            conn.commit()
+        batch = []
+        for line_num, record in itertools.chain(records, [(None, None)]):
+            if line_num is not None:
+                row, reason = validate_import_record(record, default_timestamp)
+                if row is None:
+                    skipped.append((line_num, reason))
+                    continue
+                batch.append(row)
+                section_names.add(row[3])
+            if batch and (len(batch) >= batch_size or line_num is None):
+                conn.executemany('INSERT INTO quotes (quote, author, explanation, category_id, kind_id, language_id, '
+                                 'timestamp, completed) VALUES (?, ?, ?, ?, ?, ?, ?, 1)',
+                                 [row[:3] + SECTION_KEYS[row[3]] + row[4:] for row in batch])
+                conn.commit()
+                imported += len(batch)
+                batch = []
+    finally:
+        conn.close()
+        if defer_indexes:
+            conn = get_db_connection()
+            c = conn.cursor()
+            ensure_indexes(c)
+            if search_available:
+                ensure_search_index(c)
+            conn.commit()
+            conn.close()
     conn = get_db_connection()
     c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lovecp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lovecp'))
+    c.execute('DELETE FROM top_quotes')
+    ensure_top_quotes(c)
+    for section_name in section_names:
+        bump_section_version(conn, section_name)
+    conn.commit()
+    conn.close()
+    return imported, skipped
+
+@quotes_cli.command('migrate')
+def migrate_command():
+    """Create or upgrade the database schema.
+
+    Servers run this on their own (serve.py before forking, otherwise the
+    first request); running it at deploy time keeps that off the request
+    path.
+    """
+    start = time.perf_counter()
+    version = migrate()
+    click.echo('Schema at version %d (%.0f ms).' % (version, (time.perf_counter() - start) * 1000))
+
+@quotes_cli.command('import')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'jsonl']),
+              help='Input format; guessed from the file extension by default.')
+@click.option('--batch-size', default=10000, show_default=True, help='Rows per transaction.')
+@click.option('--defer-indexes/--keep-indexes', default=True, show_default=True,
+              help='Drop secondary and search indexes during the import and rebuild them after.')
+def import_command(path, fmt, batch_size, defer_indexes):
+    """Import quotes from a CSV or JSON Lines file.
+
+    Each record needs section, quote, author and explanation; timestamp is
+    optional, as epoch ms or an ISO 8601 date and time (UTC). Invalid
+    records are skipped and reported.
+    """
+    fmt = fmt or ('csv' if path.lower().endswith('.csv') else 'jsonl')
+    migrate()
+    start = time.perf_counter()
+    imported, skipped = import_quotes(read_import_records(path, fmt), batch_size, defer_indexes)
+    elapsed = time.perf_counter() - start
+    click.echo('Imported %d quotes in %.1fs (%.0f rows/s), skipped %d.'
+               % (imported, elapsed, imported / elapsed if elapsed else 0, len(skipped)))
+    for line_num, reason in skipped[:10]:
+        click.echo('  line %d: %s' % (line_num, reason), err=True)
+    if len(skipped) > 10:
+        click.echo('  ... and %d more' % (len(skipped) - 10), err=True)
+
+@quotes_cli.command('export')
+@click.argument('output', type=click.File('wb'), default='-')
+@click.option('--format', 'fmt', type=click.Choice(sorted(EXPORT_FORMATS)), default='ndjson', show_default=True)
+@click.option('--section', 'section_name', help='Only this section.')
+@click.option('--language', help='Only sections in this language.')
+@click.option('--since', help='Only quotes from this time on: an ISO 8601 date (UTC), e.g. 2024-01-01, or epoch ms.')
+@click.option('--until', help='Only quotes from before this time.')
+@click.option('--gzip', 'compress', is_flag=True, help='Compress the output with gzip.')
+def export_command(output, fmt, section_name, language, since, until, compress):
+    """Write quotes to OUTPUT (stdout by default) as NDJSON or CSV."""
+    try:
+        section_names = export_section_names(section_name, language)
+    except KeyError as e:
+        raise click.BadParameter('unknown section or language %s' % e)
+    try:
+        since, until = parse_time_range(since, until)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    migrate()
+    conn = get_db_connection()
+    try:
+        chunks = format_export(iter_export_rows(conn, section_names, since, until), fmt)
+        if compress:
+            for data in gzip_export(chunks):
+                output.write(data)
+        else:
+            for chunk in chunks:
+                output.write(chunk.encode('utf-8'))
+    finally:
+        conn.close()
 
-@app.route('/submitlifecp_form', methods=['POST'])
-def submitlifecp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
+# Templates
 
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lifecp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
+def use_template_cache():
+    # Compiled templates are kept on disk so a fresh process loads bytecode
+    # instead of parsing.
+    cache_dir = app.config['TEMPLATE_CACHE_DIR']
+    if cache_dir and app.jinja_env.bytecode_cache is None:
+        os.makedirs(cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
 
-    return redirect(url_for('lifecp'))
-
-@app.route('/submitlifecq_form', methods=['POST'])
-def submitlifecq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lifecq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lifecq'))
-
-@app.route('/submitwisdomcq_form', methods=['POST'])
-def submitwisdomcq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'wisdomcq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('wisdomcq'))
-
-@app.route('/submitsadcq_form', methods=['POST'])
-def submitsadcq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'sadcq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('sadcq'))
-
-@app.route('/submitmotivationcq_form', methods=['POST'])
-def submitmotivationcq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'motivationcq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('motivationcq'))
-
-@app.route('/submitsuccesscq_form', methods=['POST'])
-def submitsuccesscq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'successcq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('successcq'))
-
-@app.route('/submitwisdomcp_form', methods=['POST'])
-def submitwisdomcp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'wisdomcp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('wisdomcp'))
-
-@app.route('/submitsadcp_form', methods=['POST'])
-def submitsadcp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'sadcp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('sadcp'))
-
-@app.route('/submitmotivationcp_form', methods=['POST'])
-def submitmotivationcp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'motivationcp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('motivationcp'))
-
-@app.route('/submitsuccesscp_form', methods=['POST'])
-def submitsuccesscp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'successcp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('successcp'))
-
-#chinese
-#German
-@app.route('/submitlovegq_form', methods=['POST'])
-def submitlovegq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lovegq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lovegq'))
-
-@app.route('/submitlovegp_form', methods=['POST'])
-def submitlovegp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lovegp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lovegp'))
-
-@app.route('/submitlifegp_form', methods=['POST'])
-def submitlifegp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lifegp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lifegp'))
-
-@app.route('/submitlifegq_form', methods=['POST'])
-def submitlifegq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lifegq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lifegq'))
-
-@app.route('/submitwisdomgq_form', methods=['POST'])
-def submitwisdomgq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'wisdomgq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('wisdomgq'))
-
-@app.route('/submitsadgq_form', methods=['POST'])
-def submitsadgq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'sadgq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('sadgq'))
-
-@app.route('/submitmotivationgq_form', methods=['POST'])
-def submitmotivationgq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'motivationgq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('motivationgq'))
-
-@app.route('/submitsuccessgq_form', methods=['POST'])
-def submitsuccessgq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'successgq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('successgq'))
-
-@app.route('/submitwisdomgp_form', methods=['POST'])
-def submitwisdomgp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'wisdomgp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('wisdomgp'))
-
-@app.route('/submitsadgp_form', methods=['POST'])
-def submitsadgp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'sadgp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('sadgp'))
-
-@app.route('/submitmotivationgp_form', methods=['POST'])
-def submitmotivationgp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'motivationgp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('motivationgp'))
-
-@app.route('/submitsuccessgp_form', methods=['POST'])
-def submitsuccessgp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'successgp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('successgp'))
-#German
-#Spanish
-@app.route('/submitlovesq_form', methods=['POST'])
-def submitlovesq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lovesq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lovesq'))
-
-@app.route('/submitlovesp_form', methods=['POST'])
-def submitlovesp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lovesp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lovesp'))
-
-@app.route('/submitlifesp_form', methods=['POST'])
-def submitlifesp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lifesp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lifesp'))
-
-@app.route('/submitlifesq_form', methods=['POST'])
-def submitlifesq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lifesq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lifesq'))
-
-@app.route('/submitwisdomsq_form', methods=['POST'])
-def submitwisdomsq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'wisdomsq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('wisdomsq'))
-
-@app.route('/submitsadsq_form', methods=['POST'])
-def submitsadsq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'sadsq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('sadsq'))
-
-@app.route('/submitmotivationsq_form', methods=['POST'])
-def submitmotivationsq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'motivationsq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('motivationsq'))
-
-@app.route('/submitsuccesssq_form', methods=['POST'])
-def submitsuccesssq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'successsq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('successsq'))
-
-@app.route('/submitwisdomsp_form', methods=['POST'])
-def submitwisdomsp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'wisdomsp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('wisdomsp'))
-
-@app.route('/submitsadsp_form', methods=['POST'])
-def submitsadsp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'sadsp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('sadsp'))
-
-@app.route('/submitmotivationsp_form', methods=['POST'])
-def submitmotivationsp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'motivationsp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('motivationsp'))
-
-@app.route('/submitsuccesssp_form', methods=['POST'])
-def submitsuccesssp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'successsp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('successsp'))
-#Spanish
-#Hindi
-@app.route('/submitlovehq_form', methods=['POST'])
-def submitlovehq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lovehq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lovehq'))
-
-@app.route('/submitlovehp_form', methods=['POST'])
-def submitlovehp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lovehp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lovehp'))
-
-@app.route('/submitlifehp_form', methods=['POST'])
-def submitlifehp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lifehp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lifehp'))
-
-@app.route('/submitlifehq_form', methods=['POST'])
-def submitlifehq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'lifehq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('lifehq'))
-
-@app.route('/submitwisdomhq_form', methods=['POST'])
-def submitwisdomhq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'wisdomhq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('wisdomhq'))
-
-@app.route('/submitsadhq_form', methods=['POST'])
-def submitsadhq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'sadhq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('sadhq'))
-
-@app.route('/submitmotivationhq_form', methods=['POST'])
-def submitmotivationhq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'motivationhq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('motivationhq'))
-
-@app.route('/submitsuccesshq_form', methods=['POST'])
-def submitsuccesshq_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'successhq', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('successhq'))
-
-@app.route('/submitwisdomhp_form', methods=['POST'])
-def submitwisdomhp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'wisdomhp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('wisdomhp'))
-
-@app.route('/submitsadhp_form', methods=['POST'])
-def submitsadhp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'sadhp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('sadhp'))
-
-@app.route('/submitmotivationhp_form', methods=['POST'])
-def submitmotivationhp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'motivationhp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('motivationhp'))
-
-@app.route('/submitsuccesshp_form', methods=['POST'])
-def submitsuccesshp_form():
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-
-    # Save to DB with section='loveq'
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('INSERT INTO quotes (quote, author, explanation, section, completed, timestamp) VALUES (?, ?, ?, ?, ?, ?)',
-              (quote, author, explanation, 'successhp', 1, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-
-    return redirect(url_for('successhp'))
-#Hindi
-
-@app.route('/submit', methods=['POST'])
-def submit():
-    draft_id = request.form.get('draft_id')
-    quote = request.form.get('quote')
-    author = request.form.get('author')
-    explanation = request.form.get('explanation')
-    section = request.form.get('section')
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('UPDATE quotes SET quote = ?, author = ?, explanation = ?, timestamp = ?, completed = 1 WHERE id = ?', (quote, author, explanation, timestamp, draft_id))
-    conn.commit()
-    conn.close()
-    return redirect(url_for('section_home', section_name=section))
-
-@app.route('/submit/<section>', methods=['POST'])
-def submit_form(section):
-
-    quote = request.form['quote']
-    author = request.form['author']
-    explanation = request.form['explanation']
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
-
-    new_entry = {
-        'quote': quote,
-        'author': author,
-        'explanation': explanation,
-        'timestamp': timestamp
-    }
-
-    quotes_data[section].append(new_entry)
-    return redirect(url_for(section))  # Redirect back to the right page
-
-
-@app.route('/cancel/<int:draft_id>/<section_name>')
-def cancel(draft_id, section_name):
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('DELETE FROM quotes WHERE id = ?', (draft_id,))
-    conn.commit()
-    conn.close()
-    return redirect(url_for('section_home', section_name=section_name))
-
-@app.route('/top')
-def top_quotes():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE completed = 1 ORDER BY timestamp DESC LIMIT 5')
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('top.html', quotes=quotes)
-
-@app.route('/quotes')
-def quotes():
-    return render_template('quotes.html')
-
-@app.route('/proverbs')
-def proverbs():
-    return render_template('proverbs.html')
-
-@app.route('/spanish')
-def spanish():
-    return render_template('spanish.html')
-
-@app.route('/hindi')
-def hindi():
-    return render_template('hindi.html')
-
-@app.route('/german')
-def german():
-    return render_template('german.html')
-
-@app.route('/chinese')
-def chinese():
-    return render_template('chinese.html')
-
-#chinese
-@app.route('/lovecp')
-def lovecp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lovecp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lovecp.html', quotes=quotes)
-
-
-@app.route('/successcp')
-def successcp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('successcp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('successcp.html', quotes=quotes)
-
-@app.route('/motivationcp')
-def motivationcp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('motivationcp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('motivationcp.html', quotes=quotes)
-
-@app.route('/wisdomcp')
-def wisdomcp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('wisdomcp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('wisdomcp.html', quotes=quotes)
-
-@app.route('/sadcp')
-def sadcp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('sadcp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('sadcp.html', quotes=quotes)
-
-@app.route('/lifecp')
-def lifecp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lifecp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lifecp.html', quotes=quotes)
-
-
-@app.route('/lovecq')
-def lovecq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lovecq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lovecq.html', quotes=quotes)
-
-
-
-@app.route('/successcq')
-def successcq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('successcq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('successcq.html', quotes=quotes)
-
-@app.route('/motivationcq')
-def motivationcq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('motivationcq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('motivationcq.html', quotes=quotes)
-
-@app.route('/wisdomcq')
-def wisdomcq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('wisdomcq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('wisdomcq.html', quotes=quotes)
-
-@app.route('/sadcq')
-def sadcq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('sadcq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('sadcq.html', quotes=quotes)
-
-@app.route('/lifecq')
-def lifecq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lifecq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lifecq.html', quotes=quotes)
-#chinese
-#french
-@app.route('/lovefp')
-def lovefp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lovefp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lovefp.html', quotes=quotes)
-
-
-@app.route('/successfp')
-def successfp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('successfp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('successfp.html', quotes=quotes)
-
-@app.route('/motivationfp')
-def motivationfp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('motivationfp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('motivationfp.html', quotes=quotes)
-
-@app.route('/wisdomfp')
-def wisdomfp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('wisdomfp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('wisdomfp.html', quotes=quotes)
-
-@app.route('/sadfp')
-def sadfp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('sadfp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('sadfp.html', quotes=quotes)
-
-@app.route('/lifefp')
-def lifefp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lifefp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lifefp.html', quotes=quotes)
-
-
-@app.route('/lovefq')
-def lovefq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lovefq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lovefq.html', quotes=quotes)
-
-
-
-@app.route('/successfq')
-def successfq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('successfq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('successfq.html', quotes=quotes)
-
-@app.route('/motivationfq')
-def motivationfq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('motivationfq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('motivationfq.html', quotes=quotes)
-
-@app.route('/wisdomfq')
-def wisdomfq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('wisdomfq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('wisdomfq.html', quotes=quotes)
-
-@app.route('/sadfq')
-def sadfq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('sadfq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('sadfq.html', quotes=quotes)
-
-@app.route('/lifefq')
-def lifefq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lifefq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lifefq.html', quotes=quotes)
-
-#french
-#Hindi
-@app.route('/lovehp')
-def lovehp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lovehp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lovehp.html', quotes=quotes)
-
-
-@app.route('/successhp')
-def successhp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('successhp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('successhp.html', quotes=quotes)
-
-@app.route('/motivationhp')
-def motivationhp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('motivationhp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('motivationhp.html', quotes=quotes)
-
-@app.route('/wisdomhp')
-def wisdomhp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('wisdomhp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('wisdomhp.html', quotes=quotes)
-
-@app.route('/sadhp')
-def sadhp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('sadhp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('sadhp.html', quotes=quotes)
-
-@app.route('/lifehp')
-def lifehp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lifehp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lifehp.html', quotes=quotes)
-
-
-@app.route('/lovehq')
-def lovehq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lovehq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lovehq.html', quotes=quotes)
-
-
-
-@app.route('/successhq')
-def successhq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('successhq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('successhq.html', quotes=quotes)
-
-@app.route('/motivationhq')
-def motivationhq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('motivationhq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('motivationhq.html', quotes=quotes)
-
-@app.route('/wisdomhq')
-def wisdomhq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('wisdomhq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('wisdomhq.html', quotes=quotes)
-
-@app.route('/sadhq')
-def sadhq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('sadhq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('sadhq.html', quotes=quotes)
-
-@app.route('/lifehq')
-def lifehq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lifehq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lifehq.html', quotes=quotes)
-#Hindi
-
-@app.route('/french')
-def french():
-    return render_template('french.html')
-
-
-@app.route('/about')
-def about():
-    return render_template('about.html')
-
-@app.route('/habout')
-def habout():
-    return render_template('habout.html')
-
-@app.route('/sabout')
-def sabout():
-    return render_template('sabout.html')
-
-@app.route('/gabout')
-def gabout():
-    return render_template('gabout.html')
-
-@app.route('/cabout')
-def cabout():
-    return render_template('cabout.html')
-
-@app.route('/fabout')
-def fabout():
-    return render_template('fabout.html')
-#German
-@app.route('/lovegp')
-def lovegp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lovegp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lovegp.html', quotes=quotes)
-
-
-@app.route('/successgp')
-def successgp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('successgp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('successgp.html', quotes=quotes)
-
-@app.route('/motivationgp')
-def motivationgp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('motivationgp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('motivationgp.html', quotes=quotes)
-
-@app.route('/wisdomgp')
-def wisdomgp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('wisdomgp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('wisdomgp.html', quotes=quotes)
-
-@app.route('/sadgp')
-def sadgp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('sadgp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('sadgp.html', quotes=quotes)
-
-@app.route('/lifegp')
-def lifegp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lifegp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lifegp.html', quotes=quotes)
-
-
-@app.route('/lovegq')
-def lovegq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lovegq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lovegq.html', quotes=quotes)
-
-
-
-@app.route('/successgq')
-def successgq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('successgq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('successgq.html', quotes=quotes)
-
-@app.route('/motivationgq')
-def motivationgq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('motivationgq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('motivationgq.html', quotes=quotes)
-
-@app.route('/wisdomgq')
-def wisdomgq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('wisdomgq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('wisdomgq.html', quotes=quotes)
-
-@app.route('/sadgq')
-def sadgq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('sadgq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('sadgq.html', quotes=quotes)
-
-@app.route('/lifegq')
-def lifegq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lifegq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lifegq.html', quotes=quotes)
-#German
-#Spanish
-@app.route('/lovesp')
-def lovesp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lovesp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lovesp.html', quotes=quotes)
-
-
-@app.route('/successsp')
-def successsp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('successsp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('successsp.html', quotes=quotes)
-
-@app.route('/motivationsp')
-def motivationsp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('motivationsp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('motivationsp.html', quotes=quotes)
-
-@app.route('/wisdomsp')
-def wisdomsp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('wisdomsp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('wisdomsp.html', quotes=quotes)
-
-@app.route('/sadsp')
-def sadsp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('sadsp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('sadsp.html', quotes=quotes)
-
-@app.route('/lifesp')
-def lifesp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lifesp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lifesp.html', quotes=quotes)
-
-
-@app.route('/lovesq')
-def lovesq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lovesq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lovesq.html', quotes=quotes)
-
-
-
-@app.route('/successsq')
-def successsq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('successsq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('successsq.html', quotes=quotes)
-
-@app.route('/motivationsq')
-def motivationsq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('motivationsq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('motivationsq.html', quotes=quotes)
-
-@app.route('/wisdomsq')
-def wisdomsq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('wisdomsq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('wisdomsq.html', quotes=quotes)
-
-@app.route('/sadsq')
-def sadsq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('sadsq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('sadsq.html', quotes=quotes)
-
-@app.route('/lifesq')
-def lifesq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lifesq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lifesq.html', quotes=quotes)
-#Spanish
-@app.route('/lovep')
-def lovep():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lovep',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lovep.html', quotes=quotes)
-
-
-@app.route('/successp')
-def successp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('successp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('successp.html', quotes=quotes)
-
-@app.route('/motivationp')
-def motivationp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('motivationp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('motivationp.html', quotes=quotes)
-
-@app.route('/wisdomp')
-def wisdomp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('wisdomp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('wisdomp.html', quotes=quotes)
-
-@app.route('/sadp')
-def sadp():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('sadp',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('sadp.html', quotes=quotes)
-
-@app.route('/lifep')
-def lifep():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lifep',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lifep.html', quotes=quotes)
-
-
-@app.route('/loveq')
-def loveq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('loveq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('loveq.html', quotes=quotes)
-
-
-
-@app.route('/successq')
-def successq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('successq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('successq.html', quotes=quotes)
-
-@app.route('/motivationq')
-def motivationq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('motivationq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('motivationq.html', quotes=quotes)
-
-@app.route('/wisdomq')
-def wisdomq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('wisdomq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('wisdomq.html', quotes=quotes)
-
-@app.route('/sadq')
-def sadq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('sadq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('sadq.html', quotes=quotes)
-
-@app.route('/lifeq')
-def lifeq():
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('SELECT quote, author, explanation, timestamp FROM quotes WHERE section = ? AND completed = 1 ORDER BY id DESC', ('lifeq',))
-    quotes = c.fetchall()
-    conn.close()
-    return render_template('lifeq.html', quotes=quotes)
+def warm_templates():
+    # Loading every template up front means no request pays the compile
+    # cost. Called by serve.py before forking, not at import.
+    use_template_cache()
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
 
 if __name__ == '__main__':
-    init_db()
+    migrate()
+    warm_templates()
     app.run(debug=True)
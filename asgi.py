@@ -0,0 +1,131 @@
+"""ASGI entry point for the quotes app.
+
+Serve it with any ASGI server, for example::
+
+    uvicorn asgi:application
+
+Connections, request bodies and response writes are handled on the event
+loop, so idle keep-alive connections and slow clients cost no thread. Each
+request's view (SQLite access and template rendering) runs on a pool of
+ASGI_THREADS threads, the same size as the connection pool by default, so
+a burst of requests queues for a thread instead of opening more database
+connections. Streamed responses (STREAM_SECTIONS, /export) hand the thread
+back between chunks while the client reads.
+"""
+import asyncio
+import contextvars
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from app import app, counters, migrate, warm_templates
+
+executor = ThreadPoolExecutor(max_workers=app.config['ASGI_THREADS'], thread_name_prefix='asgi_view')
+_end = object()
+
+
+def build_environ(scope, body):
+    # WSGI wants the raw path as a latin-1 string. The body has already been
+    # read in full and de-chunked by the server, so its length is known even
+    # for a chunked request, and Transfer-Encoding no longer applies.
+    server = scope.get('server') or ('localhost', 80)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope['query_string'].decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': 'HTTP/%s' % scope['http_version'],
+        'REMOTE_ADDR': scope['client'][0] if scope.get('client') else '',
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.input_terminated': True,
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope['headers']:
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name in ('CONTENT_LENGTH', 'TRANSFER_ENCODING'):
+            continue
+        if name != 'CONTENT_TYPE':
+            name = 'HTTP_' + name
+        environ[name] = environ[name] + ',' + value if name in environ else value
+    environ['CONTENT_LENGTH'] = str(len(body))
+    return environ
+
+
+async def read_body(receive):
+    # Returns None if the client went away before sending the whole body.
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            # Servers without lifespan support migrate on the first request.
+            # A failure is reported so the server stops instead of carrying
+            # on without lifespan.
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(executor, migrate)
+                await loop.run_in_executor(executor, warm_templates)
+            except Exception as e:
+                await send({'type': 'lifespan.startup.failed', 'message': repr(e)})
+                return
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await asyncio.get_running_loop().run_in_executor(executor, counters.flush)
+            executor.shutdown()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        return await lifespan(receive, send)
+    if scope['type'] != 'http':
+        return
+    body = await read_body(receive)
+    if body is None:
+        return
+    loop = asyncio.get_running_loop()
+    # Every step of a request runs in the same context, whichever pool
+    # thread picks it up, so Flask's request context survives between the
+    # chunks of a streamed response.
+    context = contextvars.copy_context()
+    started = {}
+
+    def start_response(status, headers, exc_info=None):
+        started['status'] = int(status.split(' ', 1)[0])
+        started['headers'] = [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+        return lambda data: None
+
+    def run(f, *args):
+        return loop.run_in_executor(executor, context.run, f, *args)
+
+    response = await run(app.wsgi_app, build_environ(scope, body), start_response)
+    try:
+        chunks = iter(response)
+        chunk = await run(next, chunks, _end)
+        await send({'type': 'http.response.start', 'status': started['status'], 'headers': started['headers']})
+        while chunk is not _end:
+            if chunk:
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+            chunk = await run(next, chunks, _end)
+        await send({'type': 'http.response.body', 'body': b''})
+    finally:
+        if hasattr(response, 'close'):
+            await run(response.close)
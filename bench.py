@@ -0,0 +1,365 @@
+"""Small benchmarks for the quotes app.
+
+Each benchmark works on a scratch database in a temporary directory, so
+quotes.db is never touched. Run ``python bench.py --help`` for the list.
+"""
+import argparse
+import asyncio
+import csv
+import itertools
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SEED_TIMESTAMP = 1704067200000  # 2024-01-01 00:00 UTC in epoch ms
+SECTIONS = ['loveq', 'lovep', 'lifeq', 'lifep', 'wisdomq', 'wisdomp']
+
+
+def load_app(workdir):
+    # Relative paths (quotes.db, the template cache) resolve in workdir.
+    os.chdir(workdir)
+    sys.path.insert(0, ROOT)
+    import app
+    return app
+
+
+def use_database(app, path, profile='performance'):
+    app.DATABASE = path
+    app.app.config['SQLITE_PROFILE'] = profile
+    app.migrate()
+
+
+def seed(app, rows):
+    conn = app.get_db_connection()
+    conn.executemany(
+        'INSERT INTO quotes (quote, author, explanation, category_id, kind_id, language_id, completed, timestamp) '
+        'VALUES (?, ?, ?, ?, ?, ?, 1, ?)',
+        (('quote %d' % i, 'author %d' % i, 'explanation %d' % i) + app.SECTION_KEYS[SECTIONS[i % len(SECTIONS)]]
+         + (SEED_TIMESTAMP + i,) for i in range(rows)))
+    conn.commit()
+    conn.close()
+
+
+def bench_concurrent_reads(args):
+    """Section-listing reads per second while a writer inserts continuously."""
+    workdir = tempfile.mkdtemp()
+    app = load_app(workdir)
+    for profile in ('default', 'performance'):
+        use_database(app, os.path.join(workdir, profile + '.db'), profile)
+        seed(app, args.rows)
+        stop = threading.Event()
+        counts = {'reads': 0, 'writes': 0, 'errors': 0}
+        lock = threading.Lock()
+
+        def writer():
+            conn = app.get_db_connection()
+            while not stop.is_set():
+                try:
+                    conn.execute('INSERT INTO quotes (quote, author, explanation, category_id, kind_id, language_id, '
+                                 'completed, timestamp) VALUES (?, ?, ?, ?, ?, ?, 1, ?)',
+                                 ('new', 'a', 'e') + app.SECTION_KEYS['loveq'] + (SEED_TIMESTAMP,))
+                    conn.commit()
+                    key = 'writes'
+                except app.sqlite3.OperationalError:
+                    key = 'errors'
+                with lock:
+                    counts[key] += 1
+            conn.close()
+
+        def reader(n):
+            conn = app.get_db_connection()
+            section_key = app.SECTION_KEYS[SECTIONS[n % len(SECTIONS)]]
+            while not stop.is_set():
+                try:
+                    conn.execute('SELECT id, quote, author, explanation, timestamp FROM quotes '
+                                 'WHERE category_id = ? AND kind_id = ? AND language_id = ? AND completed = 1 '
+                                 'ORDER BY id DESC LIMIT 20', section_key).fetchall()
+                    key = 'reads'
+                except app.sqlite3.OperationalError:
+                    key = 'errors'
+                with lock:
+                    counts[key] += 1
+            conn.close()
+
+        threads = [threading.Thread(target=writer)]
+        threads += [threading.Thread(target=reader, args=(n,)) for n in range(args.readers)]
+        for t in threads:
+            t.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        print('%-12s reads/s=%-10.0f writes/s=%-8.0f errors=%d' % (
+            profile, counts['reads'] / args.seconds, counts['writes'] / args.seconds, counts['errors']))
+
+
+STARTUP_PROBE = '''
+import resource, sys, time
+import flask  # measure the app module, not Flask's own import
+start = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+import app
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+timings = []
+for _ in range(2):  # a fresh database, then a current one
+    start = time.perf_counter()
+    app.migrate()
+    timings.append(time.perf_counter() - start)
+print(elapsed, rss, len(list(app.app.url_map.iter_rules())), *timings)
+'''
+
+
+def bench_startup(args):
+    """Import time, peak RSS and URL map size of a fresh interpreter, and
+    the cost of migrating a fresh and an up-to-date database."""
+    workdir = tempfile.mkdtemp()
+    runs = []
+    for _ in range(args.runs):
+        for name in os.listdir(workdir):
+            if name.startswith('quotes.db'):
+                os.remove(os.path.join(workdir, name))
+        out = subprocess.check_output([sys.executable, '-c', STARTUP_PROBE, ROOT], cwd=workdir)
+        elapsed, rss, rules, fresh, current = out.split()
+        runs.append((float(elapsed), int(rss), int(rules), float(fresh), float(current)))
+    runs.sort()
+    elapsed, rss, rules, fresh, current = runs[len(runs) // 2]
+    print('import_ms=%.1f max_rss_kb=%d url_rules=%d migrate_fresh_ms=%.1f migrate_current_ms=%.2f (median of %d)'
+          % (elapsed * 1000, rss, rules, fresh * 1000, current * 1000, args.runs))
+
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def bench_concurrent_writes(args):
+    """Quote submissions per second, one commit per row versus group commit."""
+    workdir = tempfile.mkdtemp()
+    app = load_app(workdir)
+    for profile, write_behind in itertools.product(('default', 'performance'), (False, True)):
+        use_database(app, os.path.join(workdir, '%s-%s.db' % (profile, write_behind)), profile)
+        app.app.config['WRITE_BEHIND'] = write_behind
+        stop = threading.Event()
+        latencies = []
+        errors = []
+        lock = threading.Lock()
+
+        def submitter(n):
+            client = app.app.test_client()
+            section = SECTIONS[n % len(SECTIONS)]
+            while not stop.is_set():
+                start = time.perf_counter()
+                response = client.post('/submit%s_form' % section,
+                                       data={'quote': 'q', 'author': 'a', 'explanation': 'e'})
+                with lock:
+                    if response.status_code == 302:
+                        latencies.append((time.perf_counter() - start) * 1000)
+                    else:
+                        errors.append(response.status_code)
+
+        threads = [threading.Thread(target=submitter, args=(n,)) for n in range(args.writers)]
+        for t in threads:
+            t.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        print('%-12s %-8s submits/s=%-8.0f p50=%.2fms p95=%.2fms errors=%d' % (
+            profile, 'group' if write_behind else 'per-row', len(latencies) / args.seconds,
+            percentile(latencies, 0.5), percentile(latencies, 0.95), len(errors)))
+
+
+def bench_import(args):
+    """Bulk import throughput from CSV, with indexes deferred and kept."""
+    workdir = tempfile.mkdtemp()
+    app = load_app(workdir)
+    path = os.path.join(workdir, 'quotes.csv')
+    sections = list(app.SECTIONS)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['section', 'quote', 'author', 'explanation', 'timestamp'])
+        for i in range(args.rows):
+            writer.writerow([sections[i % len(sections)], 'quote number %d' % i, 'author %d' % (i % 997),
+                             'explanation of quote %d' % i, '2024-01-01 00:00:00'])
+    for defer_indexes in (True, False):
+        use_database(app, os.path.join(workdir, 'import-%s.db' % defer_indexes))
+        start = time.perf_counter()
+        imported, skipped = app.import_quotes(app.read_import_records(path, 'csv'), defer_indexes=defer_indexes)
+        elapsed = time.perf_counter() - start
+        print('%-14s rows=%d skipped=%d %.1fs rows/s=%.0f' % (
+            'deferred' if defer_indexes else 'kept', imported, len(skipped), elapsed, imported / elapsed))
+
+
+WSGI_SERVER = """
+import sys
+sys.path.insert(0, sys.argv[1])
+import app
+app.app.run(port=int(sys.argv[2]), threaded=True)
+"""
+
+
+async def http_client(port, path, stop_at, latencies, errors):
+    # One keep-alive connection issuing GETs back to back.
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    except OSError:
+        errors.append('connect')
+        return
+    request = ('GET %s HTTP/1.1\r\nHost: localhost\r\n\r\n' % path).encode()
+    try:
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            writer.write(request)
+            head = await reader.readuntil(b'\r\n\r\n')
+            headers = dict(line.split(': ', 1) for line in head.decode('latin-1').split('\r\n')[1:] if ': ' in line)
+            headers = {name.lower(): value for name, value in headers.items()}
+            if 'content-length' in headers:
+                await reader.readexactly(int(headers['content-length']))
+            else:
+                while True:
+                    size = int((await reader.readline()).strip(), 16)
+                    await reader.readexactly(size + 2)
+                    if size == 0:
+                        break
+            if not head.startswith(b'HTTP/1.1 200'):
+                errors.append(head.split(b'\r\n', 1)[0].decode())
+            latencies.append((time.perf_counter() - start) * 1000)
+            if headers.get('connection', '').lower() == 'close':
+                writer.close()
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    except (OSError, asyncio.IncompleteReadError) as e:
+        errors.append(type(e).__name__)
+    finally:
+        writer.close()
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError('server on port %d did not start' % port)
+
+
+def bench_serving(args):
+    """Requests per second of the WSGI dev server and the ASGI entry point
+    under many concurrent keep-alive connections."""
+    workdir = tempfile.mkdtemp()
+    app = load_app(workdir)
+    use_database(app, os.path.join(workdir, 'quotes.db'))
+    seed(app, args.rows)
+    servers = {
+        'wsgi (app.run)': [sys.executable, '-c', WSGI_SERVER, ROOT, '{port}'],
+        'prefork (serve.py)': [sys.executable, os.path.join(ROOT, 'serve.py'), '--bind', '127.0.0.1:{port}'],
+    }
+    try:
+        import uvicorn  # noqa: F401
+        servers['asgi (uvicorn)'] = [sys.executable, '-m', 'uvicorn', 'asgi:application', '--app-dir', ROOT,
+                                     '--log-level', 'warning', '--port', '{port}']
+    except ImportError:
+        print('uvicorn is not installed; skipping the ASGI server')
+    for port, (label, command) in enumerate(servers.items(), 8751):
+        server = subprocess.Popen([arg.format(port=port) for arg in command], cwd=workdir,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_for_port(port)
+            for connections in args.connections:
+                latencies = []
+                errors = []
+                stop_at = time.perf_counter() + args.seconds
+
+                async def run():
+                    await asyncio.gather(*(http_client(port, '/loveq?limit=20', stop_at, latencies, errors)
+                                           for _ in range(connections)))
+
+                start = time.perf_counter()
+                asyncio.run(run())
+                elapsed = time.perf_counter() - start
+                print('%-18s connections=%-5d req/s=%-7.0f p50=%.1fms p99=%.1fms errors=%d' % (
+                    label, connections, len(latencies) / elapsed, percentile(latencies or [0], 0.5),
+                    percentile(latencies or [0], 0.99), len(errors)))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def bench_search(args):
+    """Full-text search latency over a synthetic corpus."""
+    workdir = tempfile.mkdtemp()
+    app = load_app(workdir)
+    use_database(app, os.path.join(workdir, 'search.db'))
+    rng = random.Random(0)
+    vocabulary = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 9)))
+                  for _ in range(20000)]
+    # Zipf-distributed words, so a few terms are in most rows and most are rare.
+    cum_weights = list(itertools.accumulate(1.0 / rank for rank in range(1, len(vocabulary) + 1)))
+    sections = list(app.SECTIONS)
+
+    def sentence(words):
+        return ' '.join(rng.choices(vocabulary, cum_weights=cum_weights, k=words))
+
+    start = time.perf_counter()
+    conn = app.get_db_connection()
+    conn.executemany(
+        'INSERT INTO quotes (quote, author, explanation, category_id, kind_id, language_id, completed, timestamp) '
+        'VALUES (?, ?, ?, ?, ?, ?, 1, ?)',
+        ((sentence(10), sentence(2), sentence(25)) + app.SECTION_KEYS[sections[i % len(sections)]]
+         + (SEED_TIMESTAMP + i,) for i in range(args.rows)))
+    conn.commit()
+    conn.close()
+    print('indexed %d rows in %.1fs' % (args.rows, time.perf_counter() - start))
+
+    french = [name for name, section in app.SECTIONS.items() if section.language == 'french']
+    cases = [
+        ('top-1 term', vocabulary[0], None),
+        ('top-50 term', vocabulary[50], None),
+        ('rare term', vocabulary[5000], None),
+        ('two terms', '%s %s' % (vocabulary[50], vocabulary[500]), None),
+        ('prefix', vocabulary[500][:4] + '*', None),
+        ('language filter', vocabulary[50], french),
+    ]
+    with app.app.app_context():
+        for label, text, section_names in cases:
+            samples = []
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                app.search_quotes(text, section_names, 'french' if section_names else None)
+                samples.append((time.perf_counter() - start) * 1000)
+            print('%-16s p50=%.2fms p95=%.2fms' % (label, percentile(samples, 0.5), percentile(samples, 0.95)))
+
+
+BENCHMARKS = {
+    'concurrent-reads': bench_concurrent_reads,
+    'concurrent-writes': bench_concurrent_writes,
+    'import': bench_import,
+    'search': bench_search,
+    'serving': bench_serving,
+    'startup': bench_startup,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--writers', type=int, default=16)
+    parser.add_argument('--connections', type=int, nargs='+', default=[10, 100, 500])
+    parser.add_argument('--seconds', type=float, default=3.0)
+    parser.add_argument('--runs', type=int, default=9)
+    args = parser.parse_args()
+    BENCHMARKS[args.benchmark](args)
+
+
+if __name__ == '__main__':
+    main()
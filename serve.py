@@ -0,0 +1,236 @@
+"""Preforking production server for the quotes app.
+
+    python serve.py --bind 0.0.0.0:8000 --workers 4
+
+The master imports the app once, migrates the database and compiles every
+template, then forks the workers. Each worker serves requests from
+the shared listening socket on its own threads, and starts with the app
+already loaded; memory the master touched before the fork stays shared
+copy-on-write.
+
+Signals sent to the master:
+
+SIGHUP
+    Zero-downtime reload. The new code is first loaded in a throwaway
+    process (serve.py --check); if that fails, the reload is abandoned and
+    the current master and workers carry on. Otherwise the master
+    re-executes itself with the listening socket still open, so new code
+    and templates are loaded while the old workers keep serving. Once the
+    new workers are up, the old ones finish their in-flight requests and
+    exit.
+SIGTERM, SIGINT
+    Graceful shutdown.
+
+Cold start and per-worker memory (RSS, and PSS counting shared pages
+once) are logged when workers start.
+"""
+import argparse
+import atexit
+import gc
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+start_time = time.perf_counter()
+
+from werkzeug.serving import WSGIRequestHandler, make_server  # noqa: E402
+
+log = logging.getLogger('serve')
+
+LISTEN_FD_ENV = 'QUOTES_LISTEN_FD'
+OLD_WORKERS_ENV = 'QUOTES_OLD_WORKERS'
+
+
+class RequestHandler(WSGIRequestHandler):
+    # Idle keep-alive connections are closed after this many seconds, which
+    # also bounds how long a retiring worker waits for its connections.
+    timeout = 5
+
+
+def memory_kb(pid):
+    # Returns (rss, pss) in kB from /proc, or (None, None) where /proc is
+    # not available.
+    usage = {}
+    try:
+        with open('/proc/%d/smaps_rollup' % pid) as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                if name in ('Rss', 'Pss'):
+                    usage[name] = int(value.split()[0])
+    except OSError:
+        pass
+    return usage.get('Rss'), usage.get('Pss')
+
+
+def open_listener(bind):
+    # Reuses the socket handed over by a reloading master if there is one.
+    host, _, port = bind.rpartition(':')
+    host = host or '127.0.0.1'
+    fd = os.environ.pop(LISTEN_FD_ENV, None)
+    if fd is not None:
+        sock = socket.socket(fileno=int(fd))
+    else:
+        sock = socket.create_server((host, int(port)), reuse_port=False, backlog=1024)
+    sock.set_inheritable(True)
+    return host, int(port), sock
+
+
+def run_worker(app, host, port, sock, forked_at):
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    server = make_server(host, port, app, threaded=True, request_handler=RequestHandler, fd=sock.fileno())
+    log.info('worker ready %.1f ms after fork', (time.perf_counter() - forked_at) * 1000)
+    # Request threads are joined on shutdown instead of being killed with
+    # the process.
+    server.daemon_threads = False
+    server.block_on_close = True
+
+    def stop(signum, frame):
+        # shutdown() waits for serve_forever() to return, so it cannot run
+        # on the thread that is inside serve_forever().
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    server.serve_forever()
+    server.server_close()
+
+
+def spawn_worker(app, host, port, sock):
+    forked_at = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        # The worker must never return into the master's loop. Exit handlers
+        # (such as the view counter flush) are run by hand because
+        # os._exit() skips them.
+        code = 0
+        try:
+            run_worker(app, host, port, sock, forked_at)
+        except BaseException:
+            log.exception('worker failed')
+            code = 1
+        finally:
+            atexit._run_exitfuncs()
+            os._exit(code)
+    return pid
+
+
+def load_app():
+    from app import app, migrate, warm_templates
+    migrate()
+    warm_templates()
+    return app
+
+
+def new_code_loads(timeout):
+    # Exec would replace this master even if the new code cannot be
+    # imported, orphaning the workers; a separate process fails safely.
+    try:
+        status = subprocess.run([sys.executable] + sys.argv + ['--check'], timeout=timeout).returncode
+    except subprocess.TimeoutExpired:
+        log.error('reload abandoned: new code did not load within %.0f s', timeout)
+        return False
+    if status != 0:
+        log.error('reload abandoned: new code failed to load (exit status %d)', status)
+    return status == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bind', default='127.0.0.1:8000', help='host:port to listen on')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--graceful-timeout', type=float, default=30.0,
+                        help='seconds a retiring worker gets before it is killed')
+    parser.add_argument('--check', action='store_true',
+                        help='load the app, migrate and compile templates, then exit')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(name)s %(process)d: %(message)s')
+    if args.check:
+        load_app()
+        return
+
+    host, port, sock = open_listener(args.bind)
+    app = load_app()
+    gc.collect()
+    # Objects allocated so far are never examined by the collector again, so
+    # its passes do not write to (and unshare) the pages they live on.
+    gc.freeze()
+    log.info('app loaded in %.0f ms; master rss=%s kB', (time.perf_counter() - start_time) * 1000,
+             memory_kb(os.getpid())[0])
+
+    workers = set(spawn_worker(app, host, port, sock) for _ in range(args.workers))
+    log.info('listening on %s:%d with %d workers', host, port, len(workers))
+    retiring = {int(pid): time.monotonic() + args.graceful_timeout
+                for pid in os.environ.pop(OLD_WORKERS_ENV, '').split(',') if pid}
+    for pid in retiring:
+        os.kill(pid, signal.SIGTERM)
+    report_at = time.monotonic() + 1.0
+
+    received = []
+    for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda signum, frame: received.append(signum))
+
+    while True:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                pid = 0
+            if pid == 0:
+                break
+            if pid in retiring:
+                del retiring[pid]
+            elif pid in workers:
+                workers.discard(pid)
+                if not received:
+                    log.warning('worker %d exited with status %d; restarting', pid, status)
+                    workers.add(spawn_worker(app, host, port, sock))
+        for pid, deadline in list(retiring.items()):
+            if time.monotonic() > deadline:
+                log.warning('worker %d did not exit in time; killing it', pid)
+                os.kill(pid, signal.SIGKILL)
+                retiring[pid] = float('inf')
+        if report_at and time.monotonic() > report_at:
+            report_at = None
+            for pid in sorted(workers):
+                rss, pss = memory_kb(pid)
+                log.info('worker %d rss=%s kB pss=%s kB', pid, rss, pss)
+        if received:
+            signum = received.pop(0)
+            if signum == signal.SIGHUP:
+                log.info('reloading')
+                if not new_code_loads(args.graceful_timeout):
+                    continue
+                os.environ[LISTEN_FD_ENV] = str(sock.fileno())
+                os.environ[OLD_WORKERS_ENV] = ','.join(str(pid) for pid in workers | set(retiring))
+                try:
+                    os.execv(sys.executable, [sys.executable] + sys.argv)
+                except OSError:
+                    log.exception('reload abandoned: exec failed')
+                    del os.environ[LISTEN_FD_ENV], os.environ[OLD_WORKERS_ENV]
+                    continue
+            log.info('shutting down')
+            for pid in workers | set(retiring):
+                os.kill(pid, signal.SIGTERM)
+            deadline = time.monotonic() + args.graceful_timeout
+            while workers | set(retiring) and time.monotonic() < deadline:
+                try:
+                    pid, _ = os.waitpid(-1, os.WNOHANG)
+                except ChildProcessError:
+                    break
+                if pid == 0:
+                    time.sleep(0.1)
+                workers.discard(pid)
+                retiring.pop(pid, None)
+            for pid in workers | set(retiring):
+                os.kill(pid, signal.SIGKILL)
+            return
+        time.sleep(0.2)
+
+
+if __name__ == '__main__':
+    main()
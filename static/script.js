@@ -28,3 +28,11 @@ document.addEventListener("click", function (event) {
         dropdown.style.display = "none";
     }
 });
+
+function showPopupForm() {
+    document.getElementById("popup-form").style.display = "block";
+}
+
+function hidePopupForm() {
+    document.getElementById("popup-form").style.display = "none";
+}
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as quotes_app  # noqa: E402
+
+
+@pytest.fixture
+def empty_app_module(tmp_path, monkeypatch):
+    # A scratch database per test, not yet migrated.
+    monkeypatch.setattr(quotes_app, 'DATABASE', str(tmp_path / 'quotes.db'))
+    # Pooled connections, cached listings and counts would outlive the
+    # database.
+    monkeypatch.setattr(quotes_app, 'db_pool', quotes_app.ConnectionPool())
+    monkeypatch.setattr(quotes_app, 'section_cache', quotes_app.SectionCache())
+    monkeypatch.setattr(quotes_app, 'counters', quotes_app.CounterBuffer())
+    yield quotes_app
+    # Buffered view counts belong to this database, not the next one.
+    quotes_app.counters.flush()
+
+
+@pytest.fixture
+def app_module(empty_app_module):
+    # The scratch database migrated to the current schema.
+    quotes_app.migrate()
+    yield quotes_app
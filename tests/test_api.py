@@ -0,0 +1,23 @@
+import pytest
+
+
+def write(app_module, section_name, quote):
+    conn = app_module.get_db_connection()
+    app_module.insert_quote(conn.cursor(), section_name, quote, 'author', 'explanation')
+    app_module.commit_section_write(conn, section_name)
+    conn.close()
+
+
+def test_range_and_listing_serialize_quotes_alike(app_module):
+    write(app_module, 'wisdomq', 'recent')
+    client = app_module.app.test_client()
+    listed = client.get('/api/quotes?sections=wisdomq').get_json()['sections']['wisdomq']['quotes']
+    ranged = client.get('/api/quotes/range?section=wisdomq&days=1').get_json()['quotes']
+    assert listed == ranged
+    assert [quote['quote'] for quote in ranged] == ['recent']
+
+
+@pytest.mark.parametrize('days', ['inf', '-inf', 'nan', '1e300'])
+def test_range_rejects_unusable_days(app_module, days):
+    response = app_module.app.test_client().get('/api/quotes/range?section=wisdomq&days=' + days)
+    assert response.status_code == 400
@@ -0,0 +1,83 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import asgi
+
+
+@pytest.fixture
+def executor(app_module, monkeypatch):
+    # Lifespan shutdown stops the executor, so each test gets its own.
+    monkeypatch.setattr(asgi, 'executor', ThreadPoolExecutor(max_workers=2))
+    yield asgi.executor
+    asgi.executor.shutdown()
+
+
+def call(scope, messages):
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi.application(scope, receive, send))
+    return sent
+
+
+def http_scope(method, path, headers=(), query_string=b''):
+    return {'type': 'http', 'http_version': '1.1', 'method': method, 'path': path, 'root_path': '',
+            'query_string': query_string, 'headers': list(headers), 'client': ('127.0.0.1', 50000),
+            'server': ('testserver', 80), 'scheme': 'http'}
+
+
+FORM = b'quote=asgi+quote&author=someone&explanation=why'
+
+
+@pytest.mark.parametrize('headers, chunks', [
+    ([(b'content-length', str(len(FORM)).encode())], [FORM]),
+    ([(b'transfer-encoding', b'chunked')], [FORM[:10], FORM[10:]]),
+])
+def test_form_post(app_module, executor, headers, chunks):
+    headers = [(b'content-type', b'application/x-www-form-urlencoded')] + headers
+    messages = [{'type': 'http.request', 'body': chunk, 'more_body': i < len(chunks) - 1}
+                for i, chunk in enumerate(chunks)]
+    sent = call(http_scope('POST', '/submitloveq_form', headers), messages)
+    assert sent[0]['type'] == 'http.response.start'
+    assert sent[0]['status'] == 302
+    conn = app_module.get_db_connection()
+    assert conn.execute("SELECT COUNT(*) FROM quotes WHERE quote = 'asgi quote'").fetchone()[0] == 1
+    conn.close()
+
+
+def test_streamed_response(app_module, executor, monkeypatch):
+    monkeypatch.setitem(app_module.app.config, 'STREAM_SECTIONS', True)
+    monkeypatch.setitem(app_module.app.config, 'STREAM_BUFFER_SIZE', 2)
+    conn = app_module.get_db_connection()
+    app_module.insert_quote(conn.cursor(), 'loveq', 'streamed quote', 'author', 'explanation')
+    app_module.commit_section_write(conn, 'loveq')
+    conn.close()
+    sent = call(http_scope('GET', '/loveq'), [{'type': 'http.request', 'body': b'', 'more_body': False}])
+    assert sent[0]['status'] == 200
+    bodies = [message for message in sent[1:] if message['type'] == 'http.response.body']
+    assert len(bodies) > 2
+    assert all(message['more_body'] for message in bodies[:-1])
+    assert not bodies[-1].get('more_body')
+    assert b'streamed quote' in b''.join(message['body'] for message in bodies)
+
+
+def test_lifespan(app_module, executor):
+    sent = call({'type': 'lifespan'}, [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}])
+    assert [message['type'] for message in sent] == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
+
+
+def test_lifespan_reports_a_failed_startup(app_module, executor, monkeypatch):
+    def migrate():
+        raise RuntimeError('migration failed')
+
+    monkeypatch.setattr(asgi, 'migrate', migrate)
+    sent = call({'type': 'lifespan'}, [{'type': 'lifespan.startup'}])
+    assert [message['type'] for message in sent] == ['lifespan.startup.failed']
+    assert 'migration failed' in sent[0]['message']
@@ -0,0 +1,30 @@
+def write(app_module, section_name, quote):
+    conn = app_module.get_db_connection()
+    app_module.insert_quote(conn.cursor(), section_name, quote, 'author', 'explanation')
+    app_module.commit_section_write(conn, section_name)
+    conn.close()
+
+
+def test_unchanged_section_is_not_modified(app_module):
+    write(app_module, 'wisdomq', 'first')
+    client = app_module.app.test_client()
+    etag = client.get('/wisdomq').headers['ETag']
+    assert client.get('/wisdomq', headers={'If-None-Match': etag}).status_code == 304
+
+
+def test_new_build_changes_the_etag(app_module, monkeypatch):
+    write(app_module, 'wisdomq', 'first')
+    client = app_module.app.test_client()
+    etag = client.get('/wisdomq').headers['ETag']
+    monkeypatch.setattr(app_module, 'BUILD_ID', 'next deploy')
+    assert client.get('/wisdomq', headers={'If-None-Match': etag}).status_code == 200
+
+
+def test_if_modified_since_alone_is_not_trusted(app_module):
+    write(app_module, 'wisdomq', 'first')
+    client = app_module.app.test_client()
+    last_modified = client.get('/wisdomq').headers['Last-Modified']
+    write(app_module, 'wisdomq', 'second')
+    response = client.get('/wisdomq', headers={'If-Modified-Since': last_modified})
+    assert response.status_code == 200
+    assert b'second' in response.data
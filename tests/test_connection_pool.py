@@ -0,0 +1,22 @@
+import threading
+
+
+def test_pool_never_opens_more_than_the_limit(app_module, monkeypatch):
+    monkeypatch.setitem(app_module.app.config, 'DB_POOL_MAX_CONNECTIONS', 2)
+    monkeypatch.setitem(app_module.app.config, 'DB_POOL_TIMEOUT', 0.05)
+    pool = app_module.ConnectionPool()
+    first, second = pool.acquire(), pool.acquire()
+    assert pool.acquire() is None
+    assert pool.stats()['open'] == 2 and pool.stats()['timeouts'] == 1
+
+    # A waiting request gets the connection released by another one.
+    monkeypatch.setitem(app_module.app.config, 'DB_POOL_TIMEOUT', 5)
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    waiter.start()
+    pool.release(first)
+    waiter.join()
+    assert acquired == [first]
+    pool.release(second)
+    pool.release(first)
+    assert pool.stats()['open'] == 2 and pool.stats()['idle'] == 2
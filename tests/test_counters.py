@@ -0,0 +1,29 @@
+def test_full_buffer_drops_counts_instead_of_flushing(app_module, monkeypatch):
+    monkeypatch.setitem(app_module.app.config, 'COUNTER_BUFFER_SIZE', 2)
+    counters = app_module.counters
+    counters.add(1, 'wisdomq', views=1)
+    counters.add(2, 'wisdomq', views=1)
+    counters.add(3, 'wisdomq', views=1)
+    counters.add(1, 'wisdomq', views=1)
+    stats = counters.stats()
+    assert stats['flushes'] == 0
+    assert stats['pending'] == 2
+    assert stats['dropped'] == 1
+
+
+def test_flushed_likes_show_on_the_next_request(app_module):
+    conn = app_module.get_db_connection()
+    quote_id = app_module.insert_quote(conn.cursor(), 'wisdomq', 'liked', 'author', 'explanation')
+    app_module.commit_section_write(conn, 'wisdomq')
+    conn.close()
+    client = app_module.app.test_client()
+    first = client.get('/wisdomq')
+    assert '&hearts; 0' in first.get_data(as_text=True)
+    for _ in range(3):
+        client.post('/like/%d' % quote_id)
+    app_module.counters.flush()
+
+    revalidated = client.get('/wisdomq', headers={'If-None-Match': first.headers['ETag']})
+    assert revalidated.status_code == 200
+    assert '&hearts; 3' in revalidated.get_data(as_text=True)
+    assert '&hearts; 3' in client.get('/wisdomq').get_data(as_text=True)
@@ -0,0 +1,45 @@
+import gzip
+import json
+
+import pytest
+
+
+def add_quote(app_module, section_name, quote):
+    conn = app_module.get_db_connection()
+    app_module.insert_quote(conn.cursor(), section_name, quote, 'author', 'explanation')
+    app_module.commit_section_write(conn, section_name)
+    conn.close()
+
+
+@pytest.mark.parametrize('accept_encoding, encoding', [
+    ('gzip', 'gzip'),
+    ('gzip;q=0', None),
+    ('identity', None),
+])
+def test_export_honours_gzip_quality(app_module, accept_encoding, encoding):
+    add_quote(app_module, 'wisdomq', 'exported')
+    add_quote(app_module, 'loveq', 'left out')
+    client = app_module.app.test_client()
+    response = client.get('/export?section=wisdomq', headers={'Accept-Encoding': accept_encoding})
+    assert response.status_code == 200
+    assert response.content_encoding == encoding
+    data = gzip.decompress(response.data) if encoding else response.data
+    assert [json.loads(line)['quote'] for line in data.splitlines()] == ['exported']
+
+
+def test_export_streams_without_a_pooled_connection(app_module):
+    add_quote(app_module, 'wisdomq', 'exported')
+    client = app_module.app.test_client()
+    before = app_module.db_pool.stats()
+    response = client.get('/export?section=wisdomq', buffered=False)
+    chunks = iter(response.response)
+    assert b'exported' in next(chunks)
+    after = app_module.db_pool.stats()
+    assert after['hits'] + after['misses'] == before['hits'] + before['misses']
+    response.close()
+
+
+@pytest.mark.parametrize('query', ['since=99999999999999999999999', 'until=-99999999999999999999999'])
+def test_export_rejects_out_of_range_timestamps(app_module, query):
+    response = app_module.app.test_client().get('/export?' + query)
+    assert response.status_code == 400
@@ -0,0 +1,38 @@
+import os
+import signal
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports two batches, then dies the way an OOM kill would, before the
+# deferred indexes and search triggers are rebuilt.
+KILLED_IMPORT = '''
+import os, signal, sys
+import app
+
+def records():
+    for n in range(4):
+        yield n + 1, {'section': 'wisdomq', 'quote': 'imported %d' % n, 'author': 'a', 'explanation': 'e'}
+    os.kill(os.getpid(), signal.SIGKILL)
+
+app.DATABASE = sys.argv[1]
+app.import_quotes(records(), batch_size=2)
+'''
+
+
+def test_migrate_repairs_an_import_killed_midway(app_module):
+    result = subprocess.run([sys.executable, '-c', KILLED_IMPORT, app_module.DATABASE], cwd=ROOT)
+    assert result.returncode == -signal.SIGKILL
+    conn = app_module.get_db_connection()
+    assert 'idx_quotes_section_id' not in [row[0] for row in conn.execute("SELECT name FROM sqlite_master")]
+    conn.close()
+
+    app_module.migrate()
+    conn = app_module.get_db_connection()
+    names = [row[0] for row in conn.execute("SELECT name FROM sqlite_master")]
+    conn.close()
+    assert set(app_module.QUOTE_INDEXES) <= set(names)
+    assert 'quotes_fts_insert' in names
+    with app_module.app.test_request_context():
+        assert len(app_module.search_quotes('imported')) == 4
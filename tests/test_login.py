@@ -0,0 +1,88 @@
+import threading
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+
+@pytest.fixture
+def login_app(app_module, monkeypatch):
+    # Fresh limiters and hash pool, and one user with a cheap hash.
+    monkeypatch.setattr(app_module, 'login_ip_limiter',
+                        app_module.TokenBucket('LOGIN_IP_PER_MINUTE', 'LOGIN_IP_BURST'))
+    monkeypatch.setattr(app_module, 'login_account_limiter',
+                        app_module.TokenBucket('LOGIN_ACCOUNT_PER_MINUTE', 'LOGIN_ACCOUNT_BURST'))
+    monkeypatch.setattr(app_module, 'password_checker', app_module.PasswordChecker())
+    for key, value in [('LOGIN_IP_PER_MINUTE', 1), ('LOGIN_IP_BURST', 100),
+                       ('LOGIN_ACCOUNT_PER_MINUTE', 1), ('LOGIN_ACCOUNT_BURST', 100)]:
+        monkeypatch.setitem(app_module.app.config, key, value)
+    conn = app_module.get_db_connection()
+    conn.execute('INSERT INTO users (username, email, password) VALUES (?, ?, ?)',
+                 ('user', 'user@example.org', generate_password_hash('secret', method='pbkdf2:sha256:1')))
+    conn.commit()
+    conn.close()
+    yield app_module
+
+
+def login(app_module, password, address='10.0.0.1', email='user@example.org'):
+    return app_module.app.test_client().post('/login', data={'email': email, 'password': password},
+                                             environ_base={'REMOTE_ADDR': address})
+
+
+def test_every_attempt_spends_an_address_token(login_app, monkeypatch):
+    monkeypatch.setitem(login_app.app.config, 'LOGIN_IP_BURST', 2)
+    assert login(login_app, 'secret').status_code == 302
+    assert login(login_app, 'wrong').status_code == 200
+    response = login(login_app, 'secret')
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+    assert login(login_app, 'secret', address='10.0.0.2').status_code == 302
+    assert login_app.password_checker.stats()['rejected_ip'] == 1
+
+
+def test_failures_spend_account_tokens_from_any_address(login_app, monkeypatch):
+    monkeypatch.setitem(login_app.app.config, 'LOGIN_ACCOUNT_BURST', 2)
+    assert login(login_app, 'wrong', address='10.0.0.1').status_code == 200
+    assert login(login_app, 'wrong', address='10.0.0.2').status_code == 200
+    response = login(login_app, 'secret', address='10.0.0.3')
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+    # Other accounts are unaffected.
+    assert login(login_app, 'wrong', address='10.0.0.4', email='other@example.org').status_code == 200
+    assert login_app.password_checker.stats()['rejected_account'] == 1
+
+
+def test_successes_do_not_spend_account_tokens(login_app, monkeypatch):
+    monkeypatch.setitem(login_app.app.config, 'LOGIN_ACCOUNT_BURST', 1)
+    for _ in range(3):
+        assert login(login_app, 'secret').status_code == 302
+    assert login(login_app, 'wrong').status_code == 200
+    assert login(login_app, 'secret').status_code == 429
+
+
+def test_saturated_hash_pool_is_a_503(login_app, monkeypatch):
+    monkeypatch.setitem(login_app.app.config, 'LOGIN_HASH_WORKERS', 1)
+    monkeypatch.setitem(login_app.app.config, 'LOGIN_HASH_QUEUE', 0)
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow_check(password_hash, password):
+        entered.set()
+        release.wait(5)
+        return False
+
+    monkeypatch.setattr(login_app, 'check_password_hash', slow_check)
+    first = []
+    thread = threading.Thread(target=lambda: first.append(login(login_app, 'wrong').status_code))
+    thread.start()
+    try:
+        assert entered.wait(5)
+        response = login(login_app, 'secret', address='10.0.0.2')
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+    finally:
+        release.set()
+        thread.join()
+    assert first == [200]
+    stats = login_app.password_checker.stats()
+    assert stats['rejected_busy'] == 1
+    assert stats['failures'] == 1
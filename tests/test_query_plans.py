@@ -0,0 +1,27 @@
+def query_plan(app_module, query, params):
+    conn = app_module.get_db_connection()
+    try:
+        return [row['detail'] for row in conn.execute('EXPLAIN QUERY PLAN ' + query, params)]
+    finally:
+        conn.close()
+
+
+def assert_index_scan(plan, index):
+    assert any('USING INDEX %s' % index in step for step in plan), plan
+    assert not any('TEMP B-TREE' in step for step in plan), plan
+
+
+def test_section_listing_uses_section_index(app_module):
+    plan = query_plan(app_module, *app_module.section_query('loveq', limit=20))
+    assert_index_scan(plan, 'idx_quotes_section_id')
+
+
+def test_section_page_uses_section_index(app_module):
+    plan = query_plan(app_module, *app_module.section_query('wisdomhq', before=100, limit=20))
+    assert_index_scan(plan, 'idx_quotes_section_id')
+
+
+def test_time_range_uses_timestamp_index(app_module):
+    plan = query_plan(app_module, *app_module.section_query('wisdomhq', limit=21, since=0, until=1,
+                                                           by_timestamp=True))
+    assert_index_scan(plan, 'idx_quotes_section_timestamp')
@@ -0,0 +1,20 @@
+def add_quote(app_module, section_name, quote):
+    conn = app_module.get_db_connection()
+    app_module.insert_quote(conn.cursor(), section_name, quote, 'author', 'explanation')
+    conn.commit()
+    conn.close()
+
+
+def test_latin_query_skips_the_chinese_scan(app_module, monkeypatch):
+    add_quote(app_module, 'loveq', 'zz top')
+    monkeypatch.setattr(app_module, 'search_chinese', lambda *args: 1 / 0)
+    with app_module.app.test_request_context():
+        assert [row['quote'] for row in app_module.search_quotes('zz')] == ['zz top']
+
+
+def test_chinese_query_without_language(app_module):
+    add_quote(app_module, 'lovecq', '爱是耐心')
+    add_quote(app_module, 'lovecq', '爱情')
+    with app_module.app.test_request_context():
+        assert [row['quote'] for row in app_module.search_quotes('爱')] == ['爱情', '爱是耐心']
+        assert [row['quote'] for row in app_module.search_quotes('是耐心')] == ['爱是耐心']
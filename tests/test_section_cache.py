@@ -0,0 +1,61 @@
+def write_from_another_process(app_module, section_name, quote):
+    # What another worker does: insert and bump the version, without touching
+    # this process's cache.
+    conn = app_module.get_db_connection()
+    app_module.insert_quote(conn.cursor(), section_name, quote, 'author', 'explanation')
+    app_module.bump_section_version(conn, section_name)
+    conn.commit()
+    conn.close()
+
+
+def test_listing_cached_in_one_process_sees_writes_from_another(app_module):
+    client = app_module.app.test_client()
+    write_from_another_process(app_module, 'wisdomq', 'first')
+    assert b'first' in client.get('/wisdomq?limit=10').data
+    assert b'first' in client.get('/wisdomq?limit=10').data
+    assert app_module.section_cache.stats()['hits'] >= 1
+
+    write_from_another_process(app_module, 'wisdomq', 'second')
+    assert b'second' in client.get('/wisdomq?limit=10').data
+    quotes = client.get('/api/quotes?sections=wisdomq').get_json()['sections']['wisdomq']['quotes']
+    assert [quote['quote'] for quote in quotes] == ['second', 'first']
+
+
+def test_streamed_listing_does_not_block_writers(empty_app_module, monkeypatch):
+    # Under the rollback journal an open read transaction makes a commit fail
+    # with "database is locked" once the busy timeout runs out.
+    app_module = empty_app_module
+    monkeypatch.setitem(app_module.app.config, 'SQLITE_PROFILE', 'default')
+    app_module.migrate()
+    monkeypatch.setitem(app_module.app.config, 'DB_BUSY_TIMEOUT', 100)
+    monkeypatch.setitem(app_module.app.config, 'STREAM_SECTIONS', True)
+    monkeypatch.setitem(app_module.app.config, 'STREAM_FETCH_SIZE', 2)
+    monkeypatch.setitem(app_module.app.config, 'STREAM_BUFFER_SIZE', 2)
+    for n in range(5):
+        write_from_another_process(app_module, 'wisdomq', 'quote %d' % n)
+    response = app_module.app.test_client().get('/wisdomq', buffered=False)
+    chunks = iter(response.response)
+    body = b''
+    while b'quote 4' not in body:
+        body += next(chunks)
+    write_from_another_process(app_module, 'wisdomq', 'written mid-stream')
+    body += b''.join(chunks)
+    response.close()
+    positions = [body.index(b'quote %d' % n) for n in range(5)]
+    assert positions == sorted(positions, reverse=True)
+
+
+def test_cache_is_bounded_by_rows(app_module, monkeypatch):
+    monkeypatch.setitem(app_module.app.config, 'SECTION_CACHE_ROWS', 3)
+    for n in range(4):
+        write_from_another_process(app_module, 'wisdomq', 'quote %d' % n)
+    write_from_another_process(app_module, 'lifeq', 'life quote')
+    client = app_module.app.test_client()
+    client.get('/wisdomq')
+    assert app_module.section_cache.stats()['too_large'] == 1
+    client.get('/lifeq')
+    client.get('/wisdomq?limit=2')
+    client.get('/wisdomq?limit=1')
+    stats = app_module.section_cache.stats()
+    assert stats['rows'] <= 3
+    assert stats['evictions'] == 1
@@ -0,0 +1,48 @@
+import pytest
+
+
+def test_unknown_section_pages_are_not_found(app_module):
+    client = app_module.app.test_client()
+    assert client.get('/section/wisdomq').status_code == 200
+    assert client.get('/section/nosuchq').status_code == 404
+    assert client.get('/cancel/1/nosuchq').status_code == 404
+
+
+def test_normalize_sections_quarantines_unknown_sections(empty_app_module):
+    quotes_app = empty_app_module
+    # A database one migration short of normalized sections.
+    last = quotes_app.MIGRATIONS.index(quotes_app.normalize_sections)
+    conn = quotes_app.get_db_connection()
+    c = conn.cursor()
+    for migration in quotes_app.MIGRATIONS[:last]:
+        if migration is not None:
+            migration(c)
+    c.execute('CREATE TABLE schema_version (version INTEGER NOT NULL)')
+    c.execute('INSERT INTO schema_version (version) VALUES (?)', (last,))
+    c.executemany('INSERT INTO quotes (quote, author, explanation, section, timestamp, completed) '
+                  'VALUES (?, ?, ?, ?, 0, 1)',
+                  [('kept', 'a', 'e', 'loveq'), ('misspelt', 'a', 'e', 'Loveq')])
+    conn.commit()
+    conn.close()
+
+    quotes_app.migrate()
+    conn = quotes_app.get_db_connection()
+    assert [row['quote'] for row in conn.execute('SELECT quote FROM quotes')] == ['kept']
+    assert [(row['quote'], row['section']) for row in conn.execute('SELECT quote, section FROM quotes_quarantine')] \
+        == [('misspelt', 'Loveq')]
+    conn.close()
+
+
+BIG = '99999999999999999999999'
+
+
+@pytest.mark.parametrize('path', ['/loveq?before=' + BIG, '/category/love/proverbs?before=' + BIG,
+                                  '/language/english/quotes?before=' + BIG])
+def test_out_of_range_before_is_ignored(app_module, path):
+    assert app_module.app.test_client().get(path).status_code == 200
+
+
+def test_out_of_range_ids_are_not_found(app_module):
+    client = app_module.app.test_client()
+    assert client.get('/cancel/%s/loveq' % BIG).status_code == 404
+    assert client.post('/like/' + BIG).status_code == 404